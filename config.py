@@ -64,6 +64,7 @@ SKY_COLOR = (0.52, 0.75, 0.92, 1.0)  # Azul céu realista
 # -----------------------------
 PARTICLE_LIFETIME = 2.0     # Tempo de vida das partículas (segundos)
 PARTICLE_COUNT = 8          # Número de partículas por efeito
+MAX_PARTICLES = 500         # Capacidade do pool pré-alocado de partículas
 
 # -----------------------------
 # Constantes de Física e Interação
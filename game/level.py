@@ -30,11 +30,16 @@ SISTEMA DE GRID:
 """
 
 import math
+import random
+import numpy as np
 from .levels_data import LEVELS, get_level, get_level_count
 from .physics import Physics
 from utils.sound import get_sound_manager
 from graphics.clouds import CloudSystem
-from config import WORLD_BOUNDARY_LIMIT, SPAWN_ADJUSTMENT_OFFSET
+from config import (
+    WORLD_BOUNDARY_LIMIT, SPAWN_ADJUSTMENT_OFFSET, MAX_PARTICLES,
+    CLOUD_COUNT, CLOUD_WIND_SPEED
+)
 from utils.logger import get_logger
 
 
@@ -47,10 +52,22 @@ class Level:
         self.walls = []
         self.boxes = []
         self.objectives = []
+        self.objectives_set = frozenset()  # Lookup O(1) de objetivos
+        
+        # Mesmas posições como arrays (N, 3) float32, para consumo vetorizado
+        self.walls_np = np.zeros((0, 3), dtype=np.float32)
+        self.boxes_np = np.zeros((0, 3), dtype=np.float32)
+        self.objectives_np = np.zeros((0, 3), dtype=np.float32)
         self.spawn_position = (0.0, 0.0, 0.0)
         self.move_count = 0
-        self.particles = []  # Lista de (x, y, z, start_time)
+        self.version = 0  # Incrementado sempre que as caixas mudam (cache do renderer)
+        # Pool pré-alocado de partículas: linhas [0, particle_count) estão vivas
+        # Cada linha: [x, y, z, vx, vy, vz, r, g, b, start_time, size]
+        # (float64: start_time é um timestamp grande demais para float32)
+        self.particles = np.zeros((MAX_PARTICLES, 11), dtype=np.float64)
+        self.particle_count = 0
         self.clouds = None  # Sistema de nuvens
+        self.render_clouds = None  # clouds.render já resolvido (evita lookups por frame)
 
         # Dados do nível atual
         self.level_name = ""
@@ -183,6 +200,10 @@ class Level:
         self.walls = level_data['paredes'][:]
         self.boxes = level_data['caixas'][:]
         self.objectives = level_data['objetivos'][:]
+        self.objectives_set = frozenset(self.objectives)
+        self.walls_np = np.array(self.walls, dtype=np.float32).reshape(-1, 3)
+        self.boxes_np = np.array(self.boxes, dtype=np.float32).reshape(-1, 3)
+        self.objectives_np = np.array(self.objectives, dtype=np.float32).reshape(-1, 3)
         self.spawn_position = level_data['spawn']
         
         # Validação: Verifica se spawn não está dentro de parede
@@ -205,13 +226,14 @@ class Level:
         
         # Reseta estado
         self.move_count = 0
-        self.particles = []
+        self.version += 1
+        self.particle_count = 0
         
         # Inicializa sistema de nuvens melhorado
-        from config import CLOUD_COUNT, CLOUD_WIND_SPEED
         if self.clouds:
             self.clouds.cleanup()  # Limpa nuvens antigas
         self.clouds = CloudSystem(num_clouds=CLOUD_COUNT, wind_speed=CLOUD_WIND_SPEED)
+        self.render_clouds = self.clouds.render
         
         return True
     
@@ -241,7 +263,7 @@ class Level:
             return False
         
         # Conta caixas nos objetivos corretos
-        boxes_on_targets = sum(1 for box in self.boxes if box in self.objectives)
+        boxes_on_targets = sum(1 for box in self.boxes if box in self.objectives_set)
         
         return boxes_on_targets == len(self.objectives)
     
@@ -303,15 +325,18 @@ class Level:
         # Move a caixa
         idx = self.boxes.index(box_pos)
         self.boxes[idx] = dest_pos
+        self.boxes_np[idx] = dest_pos
         self.move_count += 1
+        self.version += 1
         
         # Som de empurrar
         get_sound_manager().play('push')
         # Cria partículas espetaculares e som se atingiu objetivo
-        if dest_pos in self.objectives:
+        if dest_pos in self.objectives_set:
             # Explosão de partículas coloridas e variadas!
-            import random
-            num_particles = 50  # Aumentado para efeito mais denso
+            # Aumentado para efeito mais denso; com o pool cheio o excedente
+            # nem é sorteado
+            num_particles = min(50, MAX_PARTICLES - self.particle_count)
             
             for i in range(num_particles):
                 # Posição inicial (centro da caixa)
@@ -342,13 +367,14 @@ class Level:
                 particle_size = random.uniform(0.15, 0.4)
                 
                 # [x, y, z, vx, vy, vz, r, g, b, start_time, size]
-                self.particles.append([
+                self.particles[self.particle_count] = (
                     px, py, pz, 
                     vx, vy, vz,
                     color[0], color[1], color[2],
                     current_time,
                     particle_size
-                ])
+                )
+                self.particle_count += 1
 
             get_sound_manager().play('box_on_target')
         
@@ -364,31 +390,36 @@ class Level:
         """
         gravity = -2.0  # Gravidade bem leve para flutuar
         
-        # Atualiza e filtra partículas vivas
-        alive_particles = []
-        for p in self.particles:
-            # p = [x, y, z, vx, vy, vz, r, g, b, start_time, size]
-            start_time = p[9]
-            age = current_time - start_time
-            
-            if age < 3.0: # Tempo de vida
-                # Física
-                p[0] += p[3] * dt # x += vx * dt
-                p[1] += p[4] * dt # y += vy * dt
-                p[2] += p[5] * dt # z += vz * dt
-                
-                p[4] += gravity * dt # vy += g * dt
-                
-                # Colisão com chão - bounce suave
-                if p[1] < 0.1:
-                    p[1] = 0.1
-                    p[4] *= -0.5 # Bounce suave
-                    p[3] *= 0.9 # Atrito
-                    p[5] *= 0.9
-                
-                alive_particles.append(p)
-                
-        self.particles = alive_particles
+        # Integra direto no pool (view, sem cópia)
+        p = self.particles[:self.particle_count]
+        
+        # Física
+        p[:, 0:3] += p[:, 3:6] * dt  # posição += velocidade * dt
+        p[:, 4] += gravity * dt      # vy += g * dt
+        
+        # Colisão com chão - bounce suave
+        ground = p[:, 1] < 0.1
+        p[ground, 1] = 0.1
+        p[ground, 4] *= -0.5  # Bounce suave
+        p[ground, 3] *= 0.9   # Atrito
+        p[ground, 5] *= 0.9
+        
+        # Tempo de vida: só compacta quando alguma partícula morreu
+        # (vivas no início do pool, mortas ficam além de particle_count)
+        alive = (current_time - p[:, 9]) < 3.0
+        if not alive.all():
+            count = int(alive.sum())
+            self.particles[:count] = p[alive]
+            self.particle_count = count
+    
+    def get_active_particles(self):
+        """
+        Retorna as partículas vivas (view do pool, sem cópia).
+        
+        Returns:
+            np.ndarray: (N, 11) com [x, y, z, vx, vy, vz, r, g, b, start_time, size]
+        """
+        return self.particles[:self.particle_count]
 
     def get_progress_stats(self):
         """
@@ -397,7 +428,7 @@ class Level:
         Returns:
             dict: {'boxes_on_target', 'total_boxes', 'move_count', 'completion_percent'}
         """
-        boxes_on_target = sum(1 for box in self.boxes if box in self.objectives)
+        boxes_on_target = sum(1 for box in self.boxes if box in self.objectives_set)
         total_boxes = len(self.objectives)
         completion = (boxes_on_target / total_boxes * 100) if total_boxes > 0 else 0
         
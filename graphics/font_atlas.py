@@ -0,0 +1,255 @@
+"""
+graphics/font_atlas.py
+======================
+Atlas de fontes para texto 2D da interface.
+
+Os glifos Latin-1 (32..255) são renderizados uma única vez com pygame.font
+numa textura GL_ALPHA em grade 16x16. Cada string vira um lote de quads
+texturizados desenhado com uma única chamada glDrawArrays, em vez de uma
+chamada glutBitmapCharacter por caractere.
+"""
+
+import functools
+import numpy as np
+import pygame
+from OpenGL.GL import *
+
+
+# Deslocamento da sombra do texto em pixels
+_SHADOW_OFFSET = np.array((1.0, -1.0), dtype=np.float32)
+
+
+@functools.lru_cache(maxsize=256)
+def _glyph_codes(text):
+    """
+    Converte o texto em índices do atlas (fora de Latin-1 vira espaço).
+    
+    Memorizado: os textos do HUD e dos menus se repetem a cada frame.
+    O encode em UTF-32 dá os code points direto em C, sem ord() por caractere.
+    """
+    data = text.encode('utf-32-le', 'surrogatepass')
+    codes = np.frombuffer(data, dtype='<u4').astype(np.int32)
+    codes[codes > FontAtlas.LAST_CHAR] = 32
+    codes.setflags(write=False)
+    return codes
+
+
+class FontAtlas:
+    """Textura com todos os glifos de uma fonte e suas métricas"""
+
+    FIRST_CHAR = 32
+    LAST_CHAR = 255
+    GRID = 16
+
+    # Tamanho lógico (equivalente às fontes GLUT) -> tamanho do pygame.font
+    FONT_SIZES = {18: 24, 13: 18}
+
+    _atlases = {}
+    _unavailable = False
+
+    def __init__(self, font_size):
+        """
+        Renderiza os glifos e envia o atlas para a GPU.
+
+        Args:
+            font_size: Tamanho da fonte padrão do pygame
+        """
+        if not pygame.font.get_init():
+            pygame.font.init()
+        font = pygame.font.Font(None, font_size)
+
+        renders = {}
+        cell_w = cell_h = 1
+        for code in range(FontAtlas.FIRST_CHAR, FontAtlas.LAST_CHAR + 1):
+            try:
+                glyph = font.render(chr(code), True, (255, 255, 255))
+            except pygame.error:
+                continue  # Códigos de controle (127..159) não têm glifo
+            renders[code] = glyph
+            cell_w = max(cell_w, glyph.get_width())
+            cell_h = max(cell_h, glyph.get_height())
+
+        atlas_w = cell_w * FontAtlas.GRID
+        atlas_h = cell_h * FontAtlas.GRID
+        surface = pygame.Surface((atlas_w, atlas_h), pygame.SRCALPHA)
+        surface.fill((255, 255, 255, 0))
+
+        # Métricas por código: largura, altura, u0, v0 (topo), u1, v1 (base)
+        self.glyphs = np.zeros((256, 6), dtype=np.float32)
+        for code, glyph in renders.items():
+            index = code - FontAtlas.FIRST_CHAR
+            px = (index % FontAtlas.GRID) * cell_w
+            py = (index // FontAtlas.GRID) * cell_h
+            surface.blit(glyph, (px, py))
+            w, h = glyph.get_size()
+            self.glyphs[code] = (w, h, px / atlas_w, py / atlas_h,
+                                 (px + w) / atlas_w, (py + h) / atlas_h)
+
+        # Caracteres sem glifo ocupam o espaço de um espaço em branco
+        for code in range(256):
+            if code not in renders:
+                self.glyphs[code] = self.glyphs[32]
+        self.descent = font.get_descent()
+
+        # Quads prontos por código: cantos relativos à caneta e UVs, na ordem
+        # (base-esq, base-dir, topo-dir, topo-esq) usada por GL_QUADS
+        w, h = self.glyphs[:, 0], self.glyphs[:, 1]
+        zero = np.zeros_like(w)
+        self.quad_corners = np.stack((np.column_stack((zero, zero)),
+                                      np.column_stack((w, zero)),
+                                      np.column_stack((w, h)),
+                                      np.column_stack((zero, h))), axis=1)
+        self.quad_uvs = np.ascontiguousarray(
+            self.glyphs[:, [[2, 5], [4, 5], [4, 3], [2, 3]]])
+
+        # Só a cobertura importa: a cor vem de glColor (GL_MODULATE), então o
+        # atlas é guardado como GL_ALPHA (1 byte por texel em vez de 4)
+        alpha = np.ascontiguousarray(pygame.surfarray.array_alpha(surface).T)
+        self.texture_id = glGenTextures(1)
+        glBindTexture(GL_TEXTURE_2D, self.texture_id)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_NEAREST)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_NEAREST)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
+        glPixelStorei(GL_UNPACK_ALIGNMENT, 1)
+        glTexImage2D(GL_TEXTURE_2D, 0, GL_ALPHA8, atlas_w, atlas_h, 0,
+                     GL_ALPHA, GL_UNSIGNED_BYTE, alpha)
+        glBindTexture(GL_TEXTURE_2D, 0)
+
+    @staticmethod
+    def for_size(size):
+        """
+        Retorna o atlas equivalente à fonte GLUT usada para o tamanho.
+
+        Args:
+            size: Tamanho lógico pedido por UI.draw_text
+
+        Returns:
+            FontAtlas ou None se pygame.font não estiver disponível
+        """
+        key = 18 if size >= 18 else 13
+        atlas = FontAtlas._atlases.get(key)
+        if atlas is None and not FontAtlas._unavailable:
+            try:
+                atlas = FontAtlas(FontAtlas.FONT_SIZES[key])
+            except (pygame.error, NotImplementedError, ImportError):
+                FontAtlas._unavailable = True
+                return None
+            FontAtlas._atlases[key] = atlas
+        return atlas
+
+    def text_width(self, text):
+        """Largura do texto em pixels"""
+        return int(self.glyphs[_glyph_codes(text), 0].sum())
+
+    def build_quads(self, x, y, text):
+        """
+        Gera os vértices do lote de quads de uma string.
+
+        Args:
+            x, y: Posição da linha de base (como glRasterPos2f)
+            text: Texto a ser desenhado
+
+        Returns:
+            tuple: (posições (N*4, 2), coordenadas UV (N*4, 2)) em float32
+        """
+        codes = _glyph_codes(text)
+        widths = self.glyphs[codes, 0]
+        pen = np.empty((len(codes), 1, 2), dtype=np.float32)
+        pen[0, 0, 0] = 0.0
+        np.cumsum(widths[:-1], out=pen[1:, 0, 0])
+        pen[:, 0, 0] += x
+        pen[:, 0, 1] = y + self.descent
+
+        positions = self.quad_corners[codes] + pen
+        uvs = self.quad_uvs[codes]
+        return positions.reshape(-1, 2), uvs.reshape(-1, 2)
+
+    def draw(self, x, y, text, shadow=True):
+        """
+        Desenha o texto branco (com sombra preta) numa projeção 2D já ativa.
+
+        Args:
+            x, y: Posição da linha de base
+            text: Texto a ser desenhado
+            shadow: Se True, desenha a sombra deslocada (+1, -1)
+        """
+        self.draw_batch(((x, y, text),), shadow)
+
+    def draw_batch(self, items, shadow=True):
+        """
+        Desenha várias strings com uma única chamada glDrawArrays.
+
+        Args:
+            items: Sequência de (x, y, texto)
+            shadow: Se True, desenha as sombras deslocadas (+1, -1)
+        """
+        arrays = self._batch_arrays(tuple(items), shadow)
+        if arrays is None:
+            return
+        positions, uvs, colors = arrays
+
+        glPushAttrib(GL_ENABLE_BIT | GL_COLOR_BUFFER_BIT)
+        glEnable(GL_TEXTURE_2D)
+        glEnable(GL_BLEND)
+        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+        glBindTexture(GL_TEXTURE_2D, self.texture_id)
+
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_TEXTURE_COORD_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
+        glVertexPointer(2, GL_FLOAT, 0, positions)
+        glTexCoordPointer(2, GL_FLOAT, 0, uvs)
+        glColorPointer(3, GL_UNSIGNED_BYTE, 0, colors)
+
+        glDrawArrays(GL_QUADS, 0, len(positions))
+
+        glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_TEXTURE_COORD_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindTexture(GL_TEXTURE_2D, 0)
+        glPopAttrib()
+        # A cor corrente fica indefinida após um color array; mantém o branco
+        # que o desenho em duas passadas deixava
+        glColor3f(1.0, 1.0, 1.0)
+
+    @functools.lru_cache(maxsize=64)
+    def _batch_arrays(self, items, shadow):
+        """
+        Monta posições, UVs e cores de um lote (memorizado pelo conteúdo).
+
+        Sombra e texto vão no mesmo lote: os quads da sombra de cada string
+        (pretos, deslocados) vêm antes dos do texto (brancos).
+
+        Returns:
+            tuple: (posições, UVs, cores RGB uint8) ou None se não há glifos
+        """
+        pos_parts = []
+        uv_parts = []
+        color_parts = []
+        for x, y, text in items:
+            if not text:
+                continue
+            positions, uvs = self.build_quads(x, y, text)
+            if shadow:
+                pos_parts.append(positions + _SHADOW_OFFSET)
+                uv_parts.append(uvs)
+                color_parts.append(np.zeros((len(positions), 3), dtype=np.uint8))
+            pos_parts.append(positions)
+            uv_parts.append(uvs)
+            color_parts.append(np.full((len(positions), 3), 255, dtype=np.uint8))
+        if not pos_parts:
+            return None
+        arrays = (np.concatenate(pos_parts), np.concatenate(uv_parts),
+                  np.concatenate(color_parts))
+        for array in arrays:
+            array.setflags(write=False)
+        return arrays
+
+    @staticmethod
+    def cleanup():
+        """Libera as texturas de todos os atlas"""
+        for atlas in FontAtlas._atlases.values():
+            glDeleteTextures([atlas.texture_id])
+        FontAtlas._atlases.clear()
+        FontAtlas._batch_arrays.cache_clear()
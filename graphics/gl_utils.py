@@ -11,6 +11,7 @@ FUNÇÕES PRINCIPAIS:
 - check_gl_error(): Verifica erros OpenGL e loga se encontrado
 - gl_debug_callback(): Callback para debugging no OpenGL 4.3+
 - safe_gl_enable(): Wrapper seguro para glEnable com verificação de erros
+- GLState: Cache de estados (enable/disable, blend func e material) para evitar chamadas redundantes
 
 USO RECOMENDADO:
 ---------------
@@ -20,7 +21,7 @@ Em produção: Desative para melhor performance
 
 from typing import Optional
 from OpenGL.GL import (
-    glGetError, glEnable, glDisable,
+    glGetError, glEnable, glDisable, glBlendFunc, glLineWidth,
     GL_NO_ERROR, GL_INVALID_ENUM, GL_INVALID_VALUE,
     GL_INVALID_OPERATION, GL_STACK_OVERFLOW, GL_STACK_UNDERFLOW,
     GL_OUT_OF_MEMORY
@@ -150,6 +151,76 @@ class GLDebugger:
             self.logger.info("Verificação de erros OpenGL desabilitada (modo performance)")
 
 
+class GLState:
+    """
+    Cache do último estado enviado ao OpenGL.
+
+    Evita glEnable/glDisable e trocas de material redundantes. Só enxerga
+    mudanças feitas através dele, por isso deve ser resetado no início de
+    cada frame (e invalidado após código que altera o estado diretamente).
+    """
+
+    _enabled = {}
+    _blend_func = None
+    _line_width = None
+    _current_material = None
+
+    @staticmethod
+    def enable(capability: int) -> None:
+        """Habilita capacidade apenas se ainda não estiver habilitada"""
+        if GLState._enabled.get(capability) is not True:
+            glEnable(capability)
+            GLState._enabled[capability] = True
+
+    @staticmethod
+    def disable(capability: int) -> None:
+        """Desabilita capacidade apenas se ainda não estiver desabilitada"""
+        if GLState._enabled.get(capability) is not False:
+            glDisable(capability)
+            GLState._enabled[capability] = False
+
+    @staticmethod
+    def blend_func(src: int, dst: int) -> None:
+        """Define a função de blending apenas se for diferente da atual"""
+        if GLState._blend_func != (src, dst):
+            glBlendFunc(src, dst)
+            GLState._blend_func = (src, dst)
+
+    @staticmethod
+    def line_width(width: float) -> None:
+        """Define a espessura de linha apenas se for diferente da atual"""
+        if GLState._line_width != width:
+            glLineWidth(width)
+            GLState._line_width = width
+
+    @staticmethod
+    def use_material(key, apply_func, *args) -> None:
+        """
+        Aplica material apenas se for diferente do último aplicado.
+
+        Args:
+            key: Identificador do material (ex: status da caixa)
+            apply_func: Função que aplica o material (ex: Materials.apply_box_material)
+            *args: Argumentos repassados para apply_func
+        """
+        if GLState._current_material != key:
+            apply_func(*args)
+            GLState._current_material = key
+
+    @staticmethod
+    def invalidate_material() -> None:
+        """Esquece o material atual (ele foi alterado fora do cache)"""
+        GLState._current_material = None
+
+    @staticmethod
+    def reset() -> None:
+        """Esquece todo o estado conhecido (chamar no início do frame)"""
+        GLState._enabled.clear()
+        GLState._blend_func = None
+        GLState._line_width = None
+        GLState._current_material = None
+
+
 # Instância global do debugger (singleton pattern)
 _gl_debugger: Optional[GLDebugger] = None
 
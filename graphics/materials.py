@@ -5,6 +5,7 @@ Definições de materiais e sistema de iluminação profissional.
 Implementa materiais PBR-like para paredes, chão, caixas e objetivos.
 """
 
+import math
 from typing import Tuple
 from OpenGL.GL import (
     glEnable, glLightfv, glLightModelfv, glLightModeli, glMaterialfv, glMaterialf, glLightf,
@@ -12,7 +13,8 @@ from OpenGL.GL import (
     GL_POSITION, GL_DIFFUSE, GL_SPECULAR, GL_AMBIENT,
     GL_LIGHT_MODEL_AMBIENT, GL_LIGHT_MODEL_TWO_SIDE, GL_SHININESS,
     GL_FRONT, GL_FRONT_AND_BACK, GL_TRUE,
-    GL_CONSTANT_ATTENUATION, GL_LINEAR_ATTENUATION, GL_QUADRATIC_ATTENUATION
+    GL_CONSTANT_ATTENUATION, GL_LINEAR_ATTENUATION, GL_QUADRATIC_ATTENUATION,
+    GL_LIGHT_MODEL_COLOR_CONTROL, GL_SEPARATE_SPECULAR_COLOR
 )
 
 
@@ -35,8 +37,6 @@ class Materials:
             x: Posição X da parede (usada para seed de variação)
             z: Posição Z da parede (usada para seed de variação)
         """
-        import math
-
         # Variação procedural com múltiplas frequências (mais natural)
         variation1 = (abs(x * 0.1) + abs(z * 0.1)) % 0.3 - 0.15
         variation2 = math.sin(x * 0.3) * math.cos(z * 0.3) * 0.1
@@ -136,7 +136,6 @@ class Lighting:
         glLightModeli(GL_LIGHT_MODEL_TWO_SIDE, GL_TRUE)
 
         # Habilita cálculo de cores especulares separado
-        from OpenGL.GL import GL_LIGHT_MODEL_COLOR_CONTROL, GL_SEPARATE_SPECULAR_COLOR
         try:
             glLightModeli(GL_LIGHT_MODEL_COLOR_CONTROL, GL_SEPARATE_SPECULAR_COLOR)
         except:
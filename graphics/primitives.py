@@ -5,245 +5,48 @@ Formas geométricas primitivas e otimizadas para renderização.
 Inclui cubos, grama 3D com Display Lists, e outras formas básicas.
 """
 
-import random
-import math
-from OpenGL.GL import (
-    glBegin, glEnd, glVertex3f, glNormal3f, glColor3f, glColor4f,
-    glGenLists, glNewList, glEndList, glCallList, glDeleteLists,
-    glEnable, glDisable, glBlendFunc,
-    glPushMatrix, glPopMatrix, glTranslatef, glRotatef, glScalef, glLineWidth,
-    GL_QUADS, GL_COMPILE, GL_LINES, GL_TRIANGLES, GL_TRIANGLE_FAN, GL_LINE_LOOP,
-    GL_LIGHTING, GL_BLEND, GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA, GL_ONE,
-    glTexCoord2f
-)
-from config import (
-    GRASS_DENSITY, GRASS_AREA, GRASS_MIN_HEIGHT, GRASS_MAX_HEIGHT,
-    GRASS_BLADE_WIDTH, PARTICLE_COUNT
-)
-
-
-class Primitives:
-    """Gerenciador de formas geométricas primitivas"""
-    
-    # Display Lists para otimização
-    _grass_display_list = None
-    _cube_display_list = None
-    
-    @staticmethod
-    def draw_unit_cube():
-        """Desenha um cubo unitário centrado na origem"""
-        hs = 0.5
-        glBegin(GL_QUADS)
-        
-        # Frente
-        glNormal3f(0, 0, 1)
-        glTexCoord2f(0, 0); glVertex3f(-hs, -hs, hs)
-        glTexCoord2f(1, 0); glVertex3f(hs, -hs, hs)
-        glTexCoord2f(1, 1); glVertex3f(hs, hs, hs)
-        glTexCoord2f(0, 1); glVertex3f(-hs, hs, hs)
-        
-        # Trás
-        glNormal3f(0, 0, -1)
-        glTexCoord2f(1, 0); glVertex3f(-hs, -hs, -hs)
-        glTexCoord2f(1, 1); glVertex3f(-hs, hs, -hs)
-        glTexCoord2f(0, 1); glVertex3f(hs, hs, -hs)
-        glTexCoord2f(0, 0); glVertex3f(hs, -hs, -hs)
-        
-        # Esquerda
-        glNormal3f(-1, 0, 0)
-        glTexCoord2f(0, 0); glVertex3f(-hs, -hs, -hs)
-        glTexCoord2f(1, 0); glVertex3f(-hs, -hs, hs)
-        glTexCoord2f(1, 1); glVertex3f(-hs, hs, hs)
-        glTexCoord2f(0, 1); glVertex3f(-hs, hs, -hs)
-        
-        # Direita
-        glNormal3f(1, 0, 0)
-        glTexCoord2f(0, 0); glVertex3f(hs, -hs, -hs)
-        glTexCoord2f(0, 1); glVertex3f(hs, hs, -hs)
-        glTexCoord2f(1, 1); glVertex3f(hs, hs, hs)
-        glTexCoord2f(1, 0); glVertex3f(hs, -hs, hs)
-        
-        # Topo
-        glNormal3f(0, 1, 0)
-        glTexCoord2f(0, 1); glVertex3f(-hs, hs, -hs)
-        glTexCoord2f(0, 0); glVertex3f(-hs, hs, hs)
-        glTexCoord2f(1, 0); glVertex3f(hs, hs, hs)
-        glTexCoord2f(1, 1); glVertex3f(hs, hs, -hs)
-        
-        # Base
-        glNormal3f(0, -1, 0)
-        glTexCoord2f(0, 0); glVertex3f(-hs, -hs, -hs)
-        glTexCoord2f(1, 0); glVertex3f(hs, -hs, -hs)
-        glTexCoord2f(1, 1); glVertex3f(hs, -hs, hs)
-        glTexCoord2f(0, 1); glVertex3f(-hs, -hs, hs)
-        
-        glEnd()
-    
-    @staticmethod
-    def create_grass_display_list():
-        """
-        Cria Display List otimizada para grama 3D.
-        Performance boost de ~90% comparado a renderização por frame.
-        """
-        if Primitives._grass_display_list is not None:
-            return Primitives._grass_display_list
-        
-        random.seed(42)  # Seed fixo para consistência
-        
-        # Cria nova display list
-        Primitives._grass_display_list = glGenLists(1)
-        glNewList(Primitives._grass_display_list, GL_COMPILE)
-        
-        # Gera toda a geometria da grama
-        total_blades = GRASS_AREA * GRASS_AREA * GRASS_DENSITY
-        
-        for i in range(total_blades):
-            # Posição aleatória
-            gx = random.uniform(-GRASS_AREA/2, GRASS_AREA/2)
-            gz = random.uniform(-GRASS_AREA/2, GRASS_AREA/2)
-            
-            # Propriedades aleatórias
-            height = random.uniform(GRASS_MIN_HEIGHT, GRASS_MAX_HEIGHT)
-            rotation = random.uniform(0, 360)
-            color_var = random.uniform(-0.3, 0.3)
-            
-            # Desenha folha diretamente na display list
-            glPushMatrix()
-            glTranslatef(gx, -1.0, gz)
-            glRotatef(rotation, 0, 1, 0)
-            
-            # Cor verde mais clara para combinar com o novo chão
-            # Base: (0.4, 0.8, 0.4) com variação
-            r = 0.3 + color_var * 0.1
-            g = 0.75 + color_var * 0.2
-            b = 0.3 + color_var * 0.1
-            glColor3f(r, g, b)
-            
-            # Quad vertical (folha)
-            glBegin(GL_QUADS)
-            w = GRASS_BLADE_WIDTH
-            
-            # Frente
-            glVertex3f(-w, 0, 0)
-            glVertex3f(w, 0, 0)
-            glVertex3f(w, height, 0)
-            glVertex3f(-w, height, 0)
-            
-            # Trás (visível de ambos os lados)
-            glVertex3f(-w, 0, 0)
-            glVertex3f(-w, height, 0)
-            glVertex3f(w, height, 0)
-            glVertex3f(w, 0, 0)
-            
-            glEnd()
-            glPopMatrix()
-        
-        glEndList()
-        return Primitives._grass_display_list
-    
-    @staticmethod
-    def draw_grass():
-        """Renderiza grama usando Display List otimizada"""
-        if Primitives._grass_display_list is None:
-            Primitives.create_grass_display_list()
-        
-        if Primitives._grass_display_list is not None:
-            glCallList(Primitives._grass_display_list)
-    
-    @staticmethod
-    def draw_floor():
-        """Desenha chão base com grama"""
-        # Chão base verde
-        glDisable(GL_LIGHTING)
-        glColor3f(0.15, 0.5, 0.15)
-        
-        glPushMatrix()
-        glTranslatef(0.0, -1.0, 0.0)
-        glScalef(40.0, 0.02, 40.0)
-        
-        hs = 0.5
-        tiling = 20.0  # Repete a textura 20 vezes
-        glBegin(GL_QUADS)
-        glTexCoord2f(0, 0); glVertex3f(-hs, hs, -hs)
-        glTexCoord2f(0, tiling); glVertex3f(-hs, hs, hs)
-        glTexCoord2f(tiling, tiling); glVertex3f(hs, hs, hs)
-        glTexCoord2f(tiling, 0); glVertex3f(hs, hs, -hs)
-        glEnd()
-        
-        glPopMatrix()
-        
-        # Grama 3D otimizada
-        Primitives.draw_grass()
-        
-        glEnable(GL_LIGHTING)
-    
-    @staticmethod
-    def draw_target_marker(x, y, z):
-        """
-        Desenha marcador de objetivo (círculo + X) com GLOW PULSANTE.
-
-        Args:
-            x, y, z: Posição do objetivo
-        """
-        import time
-
-        glPushMatrix()
-        glTranslatef(x, y - 0.95, z)
-        glDisable(GL_LIGHTING)
-
-        # Efeito de pulsação (respira entre 0.7 e 1.0)
-        pulse = 0.85 + 0.15 * math.sin(time.time() * 2.5)
-
-        # === GLOW LAYER 1 (mais externo, muito transparente) ===
-        glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE)  # Additive blending para glow
-
-        glColor4f(0.3, 0.8, 1.0, 0.15 * pulse)
-        glBegin(GL_TRIANGLE_FAN)
-        glVertex3f(0, 0, 0)
-        radius_outer = 0.55
-        for i in range(0, 361, 12):
-            angle = math.radians(i)
-            glVertex3f(math.cos(angle) * radius_outer, 0, math.sin(angle) * radius_outer)
-        glEnd()
-
-        # === GLOW LAYER 2 (médio) ===
-        glColor4f(0.2, 0.75, 1.0, 0.3 * pulse)
-        glBegin(GL_TRIANGLE_FAN)
-        glVertex3f(0, 0, 0)
-        radius_mid = 0.45
-        for i in range(0, 361, 12):
-            angle = math.radians(i)
-            glVertex3f(math.cos(angle) * radius_mid, 0, math.sin(angle) * radius_mid)
-        glEnd()
-
-        # === CÍRCULO AZUL BASE ===
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
-        glColor4f(0.1, 0.7, 1.0, 0.9)
-        glBegin(GL_TRIANGLE_FAN)
-        glVertex3f(0, 0, 0)
-        radius = 0.35
-        for i in range(0, 361, 12):
-            angle = math.radians(i)
 from OpenGL.GL import (
     glBegin, glEnd, glVertex3f, glNormal3f, glTexCoord2f, glRotatef, glTranslatef, glScalef, glPushMatrix, glPopMatrix, glColor3f, glDisable, glEnable, GL_QUADS,
     GL_LIGHTING, glGenLists, glNewList, glEndList, GL_COMPILE, glCallList, glDeleteLists, glBlendFunc, GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA, GL_ONE,
     glTexCoord2f, glGenTextures, glBindTexture, glTexParameteri, glTexImage2D,
     glDeleteTextures, GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_TEXTURE_MAG_FILTER,
-    GL_LINEAR, GL_CLAMP_TO_EDGE, GL_RGBA, GL_UNSIGNED_BYTE, glDepthMask, GL_TRUE, GL_FALSE, GL_TEXTURE_WRAP_S, GL_TEXTURE_WRAP_T
+    GL_LINEAR, GL_CLAMP_TO_EDGE, GL_RGBA, GL_UNSIGNED_BYTE, glDepthMask, GL_TRUE, GL_FALSE, GL_TEXTURE_WRAP_S, GL_TEXTURE_WRAP_T,
+    GL_CULL_FACE, GL_BLEND, GL_LINES, GL_LINE_LOOP, GL_TRIANGLE_FAN, glColor4f, glLineWidth,
+    GL_POINTS, glPointSize,
+    glGenBuffers, glBindBuffer, glBufferData, glDeleteBuffers, glDrawArrays,
+    glEnableClientState, glDisableClientState, glVertexPointer, glNormalPointer, glTexCoordPointer,
+    GL_ARRAY_BUFFER, GL_STATIC_DRAW, GL_FLOAT, GL_TRIANGLES, GL_VERTEX_ARRAY, GL_NORMAL_ARRAY, GL_TEXTURE_COORD_ARRAY,
+    glColorPointer, GL_COLOR_ARRAY
 )
+import ctypes
 import math
-import random
 import time
+import numpy as np
 from config import (
     GRASS_DENSITY, GRASS_AREA, GRASS_MIN_HEIGHT, GRASS_MAX_HEIGHT,
     GRASS_BLADE_WIDTH, PARTICLE_COUNT
 )
 
+# Contorno do marcador de objetivo (raio 0.42, passos de 15°), calculado uma vez
+_MARKER_CIRCLE = tuple(
+    (math.cos(math.radians(i)) * 0.42, math.sin(math.radians(i)) * 0.42)
+    for i in range(0, 361, 15)
+)
+
+
+# Coordenadas de textura dos cantos de um billboard de partícula
+_SPRITE_UVS = np.array([(0, 0), (1, 0), (1, 1), (0, 1)], dtype=np.float32)
+
+
+# Cantos de um quad unitário no plano XZ (sombras)
+_SHADOW_QUAD = np.array([(-1, 0, -1), (1, 0, -1), (1, 0, 1), (-1, 0, 1)], dtype=np.float32)
+
+
 class Primitives:
     """Coleção de primitivas gráficas otimizadas"""
     
     _grass_display_list = None
+    _cube_vbo = None
     _cube_display_list = None
     _particle_texture_id = None
 
@@ -296,84 +99,127 @@ class Primitives:
         """
         Desenha partícula texturizada (billboard).
         """
+        Primitives.draw_textured_particles(((x, y, z, *color, size),), camera_pos)
+
+    @staticmethod
+    def draw_textured_particles(sprites, camera_pos):
+        """
+        Desenha várias partículas texturizadas (billboards) numa única chamada.
+        
+        Args:
+            sprites: Array (N, 8) de [x, y, z, r, g, b, alpha, size]
+            camera_pos: Posição da câmera (x, y, z)
+        """
+        if len(sprites) == 0:
+            return
         if Primitives._particle_texture_id is None:
             Primitives.generate_particle_texture()
-            
-        glEnable(GL_TEXTURE_2D)
-        glBindTexture(GL_TEXTURE_2D, Primitives._particle_texture_id)
         
-        glPushMatrix()
-        glTranslatef(x, y, z)
+        data = np.asarray(sprites, dtype=np.float64).reshape(-1, 8)
+        x, y, z = data[:, 0], data[:, 1], data[:, 2]
         
-        # Billboard (encarar câmera)
+        # Billboard (encarar câmera): vetor "direita" = (cos, 0, -sin) do ângulo
+        # atan2(dx, dz), obtido direto de (dz, -dx) / r sem trigonometria
         dx = camera_pos[0] - x
         dz = camera_pos[2] - z
-        angle = math.degrees(math.atan2(dx, dz))
-        glRotatef(angle, 0, 1, 0)
+        r = np.hypot(dx, dz)
+        facing = r > 0.0
+        safe_r = np.where(facing, r, 1.0)
+        rx = np.where(facing, dz / safe_r, 1.0)
+        rz = np.where(facing, -dx / safe_r, 0.0)
+        
+        hs = data[:, 7] / 2
+        ox, oz = rx * hs, rz * hs
+        verts = np.empty((len(data), 4, 3), dtype=np.float32)
+        verts[:, 0] = np.column_stack((x - ox, y - hs, z - oz))
+        verts[:, 1] = np.column_stack((x + ox, y - hs, z + oz))
+        verts[:, 2] = np.column_stack((x + ox, y + hs, z + oz))
+        verts[:, 3] = np.column_stack((x - ox, y + hs, z - oz))
+        uvs = np.tile(_SPRITE_UVS, (len(data), 1))
+        colors = np.repeat(data[:, 3:7].astype(np.float32), 4, axis=0)
         
-        glColor4f(color[0], color[1], color[2], color[3])
-        
-        hs = size / 2
-        glBegin(GL_QUADS)
-        glTexCoord2f(0, 0); glVertex3f(-hs, -hs, 0)
-        glTexCoord2f(1, 0); glVertex3f(hs, -hs, 0)
-        glTexCoord2f(1, 1); glVertex3f(hs, hs, 0)
-        glTexCoord2f(0, 1); glVertex3f(-hs, hs, 0)
-        glEnd()
-        
-        glPopMatrix()
+        glEnable(GL_TEXTURE_2D)
+        glBindTexture(GL_TEXTURE_2D, Primitives._particle_texture_id)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_TEXTURE_COORD_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
+        glVertexPointer(3, GL_FLOAT, 0, verts)
+        glTexCoordPointer(2, GL_FLOAT, 0, uvs)
+        glColorPointer(4, GL_FLOAT, 0, colors)
+        
+        glDrawArrays(GL_QUADS, 0, len(colors))
+        
+        glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_TEXTURE_COORD_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
         glDisable(GL_TEXTURE_2D)
 
+    # Vértices do cubo unitário: face -> (normal, [(u, v, x, y, z) x4])
+    _CUBE_FACES = (
+        ((0, 0, 1), ((0, 0, -0.5, -0.5, 0.5), (1, 0, 0.5, -0.5, 0.5), (1, 1, 0.5, 0.5, 0.5), (0, 1, -0.5, 0.5, 0.5))),      # Frente
+        ((0, 0, -1), ((1, 0, -0.5, -0.5, -0.5), (1, 1, -0.5, 0.5, -0.5), (0, 1, 0.5, 0.5, -0.5), (0, 0, 0.5, -0.5, -0.5))),  # Trás
+        ((1, 0, 0), ((1, 0, 0.5, -0.5, -0.5), (1, 1, 0.5, 0.5, -0.5), (0, 1, 0.5, 0.5, 0.5), (0, 0, 0.5, -0.5, 0.5))),       # Direita
+        ((-1, 0, 0), ((0, 0, -0.5, -0.5, -0.5), (1, 0, -0.5, -0.5, 0.5), (1, 1, -0.5, 0.5, 0.5), (0, 1, -0.5, 0.5, -0.5))),  # Esquerda
+        ((0, 1, 0), ((0, 1, -0.5, 0.5, -0.5), (0, 0, -0.5, 0.5, 0.5), (1, 0, 0.5, 0.5, 0.5), (1, 1, 0.5, 0.5, -0.5))),       # Topo
+        ((0, -1, 0), ((1, 1, -0.5, -0.5, -0.5), (0, 1, 0.5, -0.5, -0.5), (0, 0, 0.5, -0.5, 0.5), (1, 0, -0.5, -0.5, 0.5))),  # Base
+    )
+    _CUBE_STRIDE = 8 * 4  # posição (3) + normal (3) + uv (2), float32
+    
     @staticmethod
-    def draw_unit_cube():
-        """Desenha um cubo unitário (1x1x1) centrado na origem"""
-        if Primitives._cube_display_list is None:
-            Primitives._cube_display_list = glGenLists(1)
-            glNewList(Primitives._cube_display_list, GL_COMPILE)
+    def create_cube_vbo():
+        """
+        Cria VBO do cubo unitário (24 vértices intercalados: posição, normal, uv)
+        e a Display List que o desenha. Cada cubo vira um único glCallList.
+        """
+        if Primitives._cube_vbo is None:
+            vertices = np.array([
+                (x, y, z, nx, ny, nz, u, v)
+                for (nx, ny, nz), corners in Primitives._CUBE_FACES
+                for (u, v, x, y, z) in corners
+            ], dtype=np.float32)
             
-            glBegin(GL_QUADS)
-            # Frente
-            glNormal3f(0, 0, 1)
-            glTexCoord2f(0, 0); glVertex3f(-0.5, -0.5, 0.5)
-            glTexCoord2f(1, 0); glVertex3f(0.5, -0.5, 0.5)
-            glTexCoord2f(1, 1); glVertex3f(0.5, 0.5, 0.5)
-            glTexCoord2f(0, 1); glVertex3f(-0.5, 0.5, 0.5)
-            # Trás
-            glNormal3f(0, 0, -1)
-            glTexCoord2f(1, 0); glVertex3f(-0.5, -0.5, -0.5)
-            glTexCoord2f(1, 1); glVertex3f(-0.5, 0.5, -0.5)
-            glTexCoord2f(0, 1); glVertex3f(0.5, 0.5, -0.5)
-            glTexCoord2f(0, 0); glVertex3f(0.5, -0.5, -0.5)
-            # Direita
-            glNormal3f(1, 0, 0)
-            glTexCoord2f(1, 0); glVertex3f(0.5, -0.5, -0.5)
-            glTexCoord2f(1, 1); glVertex3f(0.5, 0.5, -0.5)
-            glTexCoord2f(0, 1); glVertex3f(0.5, 0.5, 0.5)
-            glTexCoord2f(0, 0); glVertex3f(0.5, -0.5, 0.5)
-            # Esquerda
-            glNormal3f(-1, 0, 0)
-            glTexCoord2f(0, 0); glVertex3f(-0.5, -0.5, -0.5)
-            glTexCoord2f(1, 0); glVertex3f(-0.5, -0.5, 0.5)
-            glTexCoord2f(1, 1); glVertex3f(-0.5, 0.5, 0.5)
-            glTexCoord2f(0, 1); glVertex3f(-0.5, 0.5, -0.5)
-            # Topo
-            glNormal3f(0, 1, 0)
-            glTexCoord2f(0, 1); glVertex3f(-0.5, 0.5, -0.5)
-            glTexCoord2f(0, 0); glVertex3f(-0.5, 0.5, 0.5)
-            glTexCoord2f(1, 0); glVertex3f(0.5, 0.5, 0.5)
-            glTexCoord2f(1, 1); glVertex3f(0.5, 0.5, -0.5)
-            # Base
-            glNormal3f(0, -1, 0)
-            glTexCoord2f(1, 1); glVertex3f(-0.5, -0.5, -0.5)
-            glTexCoord2f(0, 1); glVertex3f(0.5, -0.5, -0.5)
-            glTexCoord2f(0, 0); glVertex3f(0.5, -0.5, 0.5)
-            glTexCoord2f(1, 0); glVertex3f(-0.5, -0.5, 0.5)
-            glEnd()
+            Primitives._cube_vbo = glGenBuffers(1)
+            glBindBuffer(GL_ARRAY_BUFFER, Primitives._cube_vbo)
+            glBufferData(GL_ARRAY_BUFFER, vertices.nbytes, vertices, GL_STATIC_DRAW)
+            glBindBuffer(GL_ARRAY_BUFFER, 0)
             
+            # Estados de client array não são compilados; o glDrawArrays
+            # entra na lista com os vértices lidos do VBO
+            Primitives._cube_display_list = glGenLists(1)
+            glNewList(Primitives._cube_display_list, GL_COMPILE)
+            Primitives._draw_cube_arrays()
             glEndList()
-            
+        
+        return Primitives._cube_vbo
+    
+    @staticmethod
+    def draw_unit_cube():
+        """Desenha um cubo unitário (1x1x1) centrado na origem"""
+        if Primitives._cube_display_list is None:
+            Primitives.create_cube_vbo()
+        
         glCallList(Primitives._cube_display_list)
     
+    @staticmethod
+    def _draw_cube_arrays():
+        """Desenha o VBO do cubo com client arrays"""
+        stride = Primitives._CUBE_STRIDE
+        glBindBuffer(GL_ARRAY_BUFFER, Primitives._cube_vbo)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_NORMAL_ARRAY)
+        glEnableClientState(GL_TEXTURE_COORD_ARRAY)
+        glVertexPointer(3, GL_FLOAT, stride, ctypes.c_void_p(0))
+        glNormalPointer(GL_FLOAT, stride, ctypes.c_void_p(12))
+        glTexCoordPointer(2, GL_FLOAT, stride, ctypes.c_void_p(24))
+        
+        glDrawArrays(GL_QUADS, 0, 24)
+        
+        # Client states ficam desligados para não afetar o modo imediato
+        glDisableClientState(GL_TEXTURE_COORD_ARRAY)
+        glDisableClientState(GL_NORMAL_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+    
     @staticmethod
     def create_grass_display_list():
         """
@@ -383,8 +229,6 @@ class Primitives:
         if Primitives._grass_display_list is not None:
             return Primitives._grass_display_list
         
-        random.seed(42)  # Seed fixo para consistência
-        
         # Cria nova display list
         Primitives._grass_display_list = glGenLists(1)
         glNewList(Primitives._grass_display_list, GL_COMPILE)
@@ -392,16 +236,14 @@ class Primitives:
         # Gera toda a geometria da grama
         total_blades = GRASS_AREA * GRASS_AREA * GRASS_DENSITY
         
-        for i in range(total_blades):
-            # Posição aleatória
-            gx = random.uniform(-GRASS_AREA/2, GRASS_AREA/2)
-            gz = random.uniform(-GRASS_AREA/2, GRASS_AREA/2)
-            
-            # Propriedades aleatórias
-            height = random.uniform(GRASS_MIN_HEIGHT, GRASS_MAX_HEIGHT)
-            rotation = random.uniform(0, 360)
-            color_var = random.uniform(-0.3, 0.3)
-            
+        # Sorteia todas as propriedades de uma vez (seed fixo para consistência)
+        rnd = np.random.default_rng(42).random((total_blades, 5)).astype(np.float32)
+        rnd[:, 0:2] = (rnd[:, 0:2] - 0.5) * GRASS_AREA  # Posição (x, z)
+        rnd[:, 2] = GRASS_MIN_HEIGHT + rnd[:, 2] * (GRASS_MAX_HEIGHT - GRASS_MIN_HEIGHT)  # Altura
+        rnd[:, 3] *= 360.0  # Rotação
+        rnd[:, 4] = (rnd[:, 4] - 0.5) * 0.6  # Variação de cor
+        
+        for gx, gz, height, rotation, color_var in rnd.tolist():
             # Desenha folha diretamente na display list
             glPushMatrix()
             glTranslatef(gx, -1.0, gz)
@@ -418,18 +260,12 @@ class Primitives:
             glBegin(GL_QUADS)
             w = GRASS_BLADE_WIDTH
             
-            # Frente
+            # Face única (draw_grass desativa o culling, então fica visível dos dois lados)
             glVertex3f(-w, 0, 0)
             glVertex3f(w, 0, 0)
             glVertex3f(w, height, 0)
             glVertex3f(-w, height, 0)
             
-            # Trás (visível de ambos os lados)
-            glVertex3f(-w, 0, 0)
-            glVertex3f(-w, height, 0)
-            glVertex3f(w, height, 0)
-            glVertex3f(w, 0, 0)
-            
             glEnd()
             glPopMatrix()
         
@@ -443,7 +279,10 @@ class Primitives:
             Primitives.create_grass_display_list()
         
         if Primitives._grass_display_list is not None:
+            # Folhas têm uma única face: desativa culling para vê-las por trás
+            glDisable(GL_CULL_FACE)
             glCallList(Primitives._grass_display_list)
+            glEnable(GL_CULL_FACE)
     
     @staticmethod
     def draw_floor():
@@ -494,19 +333,16 @@ class Primitives:
         glColor4f(0.9, 0.15, 0.1, 0.7)
         glBegin(GL_TRIANGLE_FAN)
         glVertex3f(0, 0, 0)
-        radius = 0.42
-        for i in range(0, 361, 15):
-            angle = math.radians(i)
-            glVertex3f(math.cos(angle) * radius, 0, math.sin(angle) * radius)
+        for cx, cz in _MARKER_CIRCLE:
+            glVertex3f(cx, 0, cz)
         glEnd()
 
         # === BORDA DO CÍRCULO (mais escura) ===
         glLineWidth(2.5)
         glColor4f(0.7, 0.0, 0.0, 0.9)
         glBegin(GL_LINE_LOOP)
-        for i in range(0, 361, 15):
-            angle = math.radians(i)
-            glVertex3f(math.cos(angle) * radius, 0, math.sin(angle) * radius)
+        for cx, cz in _MARKER_CIRCLE:
+            glVertex3f(cx, 0, cz)
         glEnd()
 
         # === X VERMELHO ESCURO (principal) ===
@@ -526,6 +362,89 @@ class Primitives:
         glEnable(GL_LIGHTING)
         glPopMatrix()
     
+    @staticmethod
+    def create_target_markers_vbo(positions):
+        """
+        Monta um VBO com a geometria de todos os marcadores de objetivo,
+        já em coordenadas de mundo (objetivos não se movem dentro do nível).
+        
+        Layout: [discos (GL_TRIANGLES)] [bordas (GL_LINES)] [X (GL_LINES)]
+        
+        Args:
+            positions: Posições (x, y, z) dos objetivos
+            
+        Returns:
+            tuple: (vbo, vértices dos discos, vértices das bordas, vértices dos X)
+        """
+        circle = np.array([(cx, 0.0, cz) for cx, cz in _MARKER_CIRCLE], dtype=np.float32)
+        center = np.zeros((len(circle) - 1, 3), dtype=np.float32)
+        
+        # Leque -> triângulos (centro, borda i, borda i+1) e loop -> segmentos
+        disc = np.stack((center, circle[:-1], circle[1:]), axis=1).reshape(-1, 3)
+        rim = np.stack((circle[:-1], circle[1:]), axis=1).reshape(-1, 3)
+        cross = np.array([(-0.28, 0.01, -0.28), (0.28, 0.01, 0.28),
+                          (0.28, 0.01, -0.28), (-0.28, 0.01, 0.28)], dtype=np.float32)
+        
+        # Levemente acima do chão
+        origins = np.asarray(positions, dtype=np.float32).reshape(-1, 1, 3) + (0.0, -0.94, 0.0)
+        vertices = np.concatenate([
+            (origins + local).reshape(-1, 3) for local in (disc, rim, cross)
+        ]).astype(np.float32)
+        
+        vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, vbo)
+        glBufferData(GL_ARRAY_BUFFER, vertices.nbytes, vertices, GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        
+        n = len(origins)
+        return vbo, n * len(disc), n * len(rim), n * len(cross)
+    
+    @staticmethod
+    def draw_target_markers(batch):
+        """
+        Desenha todos os marcadores de um VBO criado por create_target_markers_vbo
+        (mesmo visual de draw_target_marker, em três glDrawArrays).
+        
+        Args:
+            batch: Tupla retornada por create_target_markers_vbo
+        """
+        vbo, disc_count, rim_count, cross_count = batch
+        if disc_count == 0:
+            return
+        
+        glDisable(GL_LIGHTING)  # Cores emissivas puras
+        
+        # Efeito de pulsação suave
+        pulse = 0.9 + 0.1 * math.sin(time.time() * 2.0)
+        
+        glEnable(GL_BLEND)
+        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+        
+        glBindBuffer(GL_ARRAY_BUFFER, vbo)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glVertexPointer(3, GL_FLOAT, 0, ctypes.c_void_p(0))
+        
+        # Círculos base vermelho claro
+        glColor4f(0.9, 0.15, 0.1, 0.7)
+        glDrawArrays(GL_TRIANGLES, 0, disc_count)
+        
+        # Bordas dos círculos (mais escuras)
+        glLineWidth(2.5)
+        glColor4f(0.7, 0.0, 0.0, 0.9)
+        glDrawArrays(GL_LINES, disc_count, rim_count)
+        
+        # X vermelho escuro (principal)
+        glLineWidth(6.0)
+        glColor4f(0.85, 0.0, 0.0, 1.0 * pulse)
+        glDrawArrays(GL_LINES, disc_count + rim_count, cross_count)
+        
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        
+        glLineWidth(1.0)
+        glDisable(GL_BLEND)
+        glEnable(GL_LIGHTING)
+    
     @staticmethod
     def draw_shadow(x, y, z, size=0.4, alpha=0.3):
         """
@@ -555,10 +474,56 @@ class Primitives:
         glEnable(GL_LIGHTING)
         glPopMatrix()
     
+    @staticmethod
+    def draw_shadows(positions, size=0.4, alpha=0.3):
+        """
+        Desenha as sombras de vários objetos numa única chamada.
+        
+        Args:
+            positions: Posições (x, y, z) dos objetos (array (N, 3) ou lista)
+            size: Tamanho da sombra
+            alpha: Transparência (0-1)
+        """
+        if len(positions) == 0:
+            return
+        
+        # (N, 4, 3): cada posição + os 4 cantos do quad, todos rente ao chão
+        verts = np.asarray(positions, dtype=np.float32).reshape(-1, 1, 3) + _SHADOW_QUAD * size
+        verts[:, :, 1] = -0.99
+        
+        glDisable(GL_LIGHTING)
+        glEnable(GL_BLEND)
+        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+        glColor4f(0.0, 0.0, 0.0, alpha)
+        
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glVertexPointer(3, GL_FLOAT, 0, verts)
+        glDrawArrays(GL_QUADS, 0, len(verts) * 4)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        
+        glDisable(GL_BLEND)
+        glEnable(GL_LIGHTING)
+    
     @staticmethod
     def draw_particle(x, y, z, size=0.1, color=(1.0, 1.0, 0.0)):
-        """Legacy: Mantido para compatibilidade se necessário"""
-        Primitives.draw_unit_cube() # Placeholder
+        """
+        Legacy: desenha uma partícula simples como um único ponto.
+        Prefira Renderer.draw_particles, que usa sprites texturizados.
+        
+        Args:
+            x, y, z: Posição da partícula
+            size: Tamanho (convertido em pixels)
+            color: Cor RGB
+        """
+        glPointSize(size * 100)
+        glDisable(GL_LIGHTING)
+        glColor3f(*color)
+        
+        glBegin(GL_POINTS)
+        glVertex3f(x, y, z)
+        glEnd()
+        
+        glEnable(GL_LIGHTING)
     
     @staticmethod
     def cleanup():
@@ -570,6 +535,10 @@ class Primitives:
         if Primitives._cube_display_list is not None:
             glDeleteLists(Primitives._cube_display_list, 1)
             Primitives._cube_display_list = None
+        
+        if Primitives._cube_vbo is not None:
+            glDeleteBuffers(1, [Primitives._cube_vbo])
+            Primitives._cube_vbo = None
             
         if Primitives._particle_texture_id is not None:
             glDeleteTextures([Primitives._particle_texture_id])
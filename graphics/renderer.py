@@ -36,19 +36,46 @@ ESTADOS VISUAIS DAS CAIXAS:
 """
 
 import math
+import numpy as np
 from OpenGL.GL import *
 from OpenGL.GLU import *
 from config import *
+from game.physics import Physics
 from .materials import Materials, Lighting
 from .primitives import Primitives
 from .ui import UI
 from .clouds import CloudSystem
 from .textures import TextureManager
+from .gl_utils import GLState
+
+
+# Material das caixas por status: (cor RGBA, shininess)
+_BOX_MATERIAL = {
+    'on_target': (BOX_COLOR_ON_TARGET, BOX_SHININESS_ON_TARGET),  # Dourado
+    'pushable': ((1.0, 1.0, 0.2, 1.0), BOX_SHININESS_PUSHABLE),   # Amarelo claro (como solicitado)
+    'blocked': (BOX_COLOR_BLOCKED, BOX_SHININESS_BLOCKED),        # Vermelho
+    'normal': (BOX_COLOR_NORMAL, BOX_SHININESS_NORMAL),           # Marrom
+}
 
 
 class Renderer:
     """Gerenciador de renderização 3D"""
     
+    # Display lists com a geometria estática (chão + paredes) de cada nível
+    _static_scenes = {}
+    
+    # VBOs dos marcadores de objetivo de cada nível (índice -> batch)
+    _marker_batches = {}
+    
+    # Display list do cenário de demonstração do menu
+    _menu_background_list = None
+    
+    # Códigos int8 retornados por compute_all_box_statuses (código -> status)
+    BOX_STATUSES = ('normal', 'on_target', 'pushable', 'blocked')
+    
+    # Último resultado de _get_box_statuses: (chave, status, ordem de desenho)
+    _box_status_cache = (None, None, None)
+    
     @staticmethod
     def init_opengl():
         """Inicializa OpenGL com todas as configurações"""
@@ -90,9 +117,19 @@ class Renderer:
         Args:
             width, height: Dimensões da janela
         """
+        # Matriz equivalente a gluPerspective, montada uma vez por resize
+        f = 1.0 / math.tan(math.radians(FOV) / 2.0)
+        aspect = width / float(height)
+        depth = NEAR_PLANE - FAR_PLANE
+        projection = np.array([
+            [f / aspect, 0.0, 0.0, 0.0],
+            [0.0, f, 0.0, 0.0],
+            [0.0, 0.0, (FAR_PLANE + NEAR_PLANE) / depth, 2.0 * FAR_PLANE * NEAR_PLANE / depth],
+            [0.0, 0.0, -1.0, 0.0],
+        ], dtype=np.float32)
+        
         glMatrixMode(GL_PROJECTION)
-        glLoadIdentity()
-        gluPerspective(FOV, width / float(height), NEAR_PLANE, FAR_PLANE)
+        glLoadMatrixf(np.ascontiguousarray(projection.T))  # OpenGL espera column-major
         glMatrixMode(GL_MODELVIEW)
     
     @staticmethod
@@ -103,14 +140,24 @@ class Renderer:
         Args:
             player: Objeto Player com posição e rotação
         """
-        glLoadIdentity()
-        
-        # Rotação da câmera
-        glRotatef(player.camera_pitch, 1, 0, 0)
-        glRotatef(player.camera_yaw, 0, 1, 0)
+        # Rotação da câmera: Rx(pitch) @ Ry(yaw), composta em NumPy
+        pitch = math.radians(player.camera_pitch)
+        yaw = math.radians(player.camera_yaw)
+        cp, sp = math.cos(pitch), math.sin(pitch)
+        cy, sy = math.cos(yaw), math.sin(yaw)
+        
+        view = np.array([
+            [cy, 0.0, sy, 0.0],
+            [sp * sy, cp, -sp * cy, 0.0],
+            [-cp * sy, sp, cp * cy, 0.0],
+            [0.0, 0.0, 0.0, 1.0],
+        ], dtype=np.float32)
         
         # Posição da câmera (inverte pois é a câmera que move)
-        glTranslatef(-player.x, -PLAYER_EYE_HEIGHT, -player.z)
+        view[:3, 3] = view[:3, :3] @ np.array((-player.x, -PLAYER_EYE_HEIGHT, -player.z), dtype=np.float32)
+        
+        # Uma única chamada no lugar de glLoadIdentity + glRotatef x2 + glTranslatef
+        glLoadMatrixf(np.ascontiguousarray(view.T))  # OpenGL espera column-major
     
     @staticmethod
     def draw_wall(x, y, z):
@@ -131,6 +178,68 @@ class Renderer:
         
         glPopMatrix()
     
+    @staticmethod
+    def _render_static_scene(level):
+        """
+        Desenha chão e paredes do nível com uma única chamada.
+        Nada disso se move dentro de um nível, então é compilado uma vez
+        numa Display List (batch estático) indexada pelo nível e reutilizada
+        por render_game_scene e render_victory.
+        
+        Args:
+            level: Objeto Level
+        """
+        key = level.current_level_index
+        scene_list = Renderer._static_scenes.get(key)
+        
+        if scene_list is None:
+            # Recursos usados pela lista precisam existir antes de compilá-la
+            # (não pode criar lista dentro de lista)
+            Primitives.create_cube_vbo()
+            Primitives.create_grass_display_list()
+            
+            scene_list = glGenLists(1)
+            glNewList(scene_list, GL_COMPILE)
+            
+            # Chão
+            TextureManager().bind('floor')
+            Primitives.draw_floor()
+            TextureManager().bind(None)
+            
+            # Paredes
+            TextureManager().bind('wall')
+            for (x, y, z) in level.walls:
+                Materials.apply_wall_material_varied(x, z)
+                glPushMatrix()
+                glTranslatef(x, y, z)
+                glScalef(1.0, 2.0, 1.0)
+                Primitives.draw_unit_cube()
+                glPopMatrix()
+            TextureManager().bind(None)
+            
+            glEndList()
+            Renderer._static_scenes[key] = scene_list
+        
+        glCallList(scene_list)
+        GLState.invalidate_material()  # A lista aplica materiais próprios
+    
+    @staticmethod
+    def draw_target_markers(level):
+        """
+        Desenha todos os marcadores de objetivo do nível num único VBO,
+        criado na primeira vez que o nível é desenhado.
+        
+        Args:
+            level: Objeto Level
+        """
+        key = level.current_level_index
+        batch = Renderer._marker_batches.get(key)
+        if batch is None:
+            batch = Primitives.create_target_markers_vbo(level.objectives_np)
+            Renderer._marker_batches[key] = batch
+        
+        Primitives.draw_target_markers(batch)
+    
     @staticmethod
     def draw_box(x, y, z, status='normal'):
         """
@@ -144,41 +253,26 @@ class Renderer:
         glTranslatef(x, y - 0.5, z)
         glScalef(1.0, 1.0, 1.0)
         
-        # Define cor baseada no status
-        if status == 'on_target':
-            color = (1.0, 0.84, 0.0, 1.0)  # Dourado
-            shininess = 64.0
-        elif status == 'pushable':
-            # Amarelo Claro para indicar interação (como solicitado)
-            color = (1.0, 1.0, 0.2, 1.0)
-            shininess = 32.0
-        elif status == 'blocked':
-            color = (0.9, 0.2, 0.2, 1.0)  # Vermelho
-            shininess = 32.0
-        else:  # normal
-            color = (0.72, 0.48, 0.16, 1.0)  # Marrom
-            shininess = 32.0
-        
-        Materials.apply_box_material(color, shininess)
+        color, shininess = _BOX_MATERIAL.get(status, _BOX_MATERIAL['normal'])
+        
+        # Caixas chegam agrupadas por status: material só muda entre grupos
+        GLState.use_material(status, Materials.apply_box_material, color, shininess)
         
         TextureManager().bind('box')
         Primitives.draw_unit_cube()
         TextureManager().bind(None)
         
-        # Restaura material padrão
-        Materials.apply_wall_material()
-        
         glPopMatrix()
     
     @staticmethod
-    def get_box_status(box_pos, objectives, player, level):
+    def get_box_status(box_pos, objectives_set, player, level):
         """
         Determina status visual de uma caixa.
         CORRIGIDO: Detecção mais precisa e confiável.
         
         Args:
             box_pos: Posição da caixa (tupla (x, y, z))
-            objectives: Lista de objetivos
+            objectives_set: Conjunto de objetivos (Level.objectives_set)
             player: Objeto Player
             level: Objeto Level
             
@@ -186,11 +280,10 @@ class Renderer:
             str: Status da caixa ('normal', 'on_target', 'pushable', 'blocked')
         """
         # Caixa no objetivo (prioridade máxima)
-        if box_pos in objectives:
+        if box_pos in objectives_set:
             return 'on_target'
         
         # Obtém posição do jogador no grid
-        from game.physics import Physics
         px = Physics.grid_round(player.x)
         pz = Physics.grid_round(player.z)
         
@@ -217,17 +310,111 @@ class Renderer:
         
         return 'normal'
     
+    @staticmethod
+    def compute_all_box_statuses(boxes, objectives, player, level):
+        """
+        Versão vetorizada de get_box_status: classifica todas as caixas
+        de uma vez com operações NumPy.
+        
+        Args:
+            boxes: Posições das caixas (array (N, 3) ou lista de tuplas)
+            objectives: Posições dos objetivos (array (M, 3) ou lista de tuplas)
+            player: Objeto Player
+            level: Objeto Level
+            
+        Returns:
+            np.ndarray: Códigos int8 (índices de Renderer.BOX_STATUSES)
+        """
+        boxes = np.asarray(boxes, dtype=np.float32).reshape(-1, 3)
+        statuses = np.zeros(len(boxes), dtype=np.int8)
+        if len(boxes) == 0:
+            return statuses
+        
+        # Caixa no objetivo (prioridade máxima)
+        objectives = np.asarray(objectives, dtype=np.float32).reshape(-1, 3)
+        on_target = (boxes[:, None, :] == objectives[None, :, :]).all(-1).any(1)
+        
+        # Caixa na frente do jogador e próxima (até 2.5 unidades)
+        px = Physics.grid_round(player.x)
+        pz = Physics.grid_round(player.z)
+        dir_x, dir_z = player.get_facing_direction()
+        
+        in_front = (boxes[:, 0] == px + dir_x) & (boxes[:, 2] == pz + dir_z)
+        close = np.maximum(np.abs(boxes[:, 0] - player.x), np.abs(boxes[:, 2] - player.z)) <= 2.5
+        facing = in_front & close & ~on_target
+        
+        # No máximo uma caixa fica na frente: uma única consulta de empurrão
+        if facing.any():
+            can_push, _, _ = level.can_push_box(player.x, player.z, dir_x, dir_z)
+            statuses[facing] = 2 if can_push else 3
+        
+        statuses[on_target] = 1
+        return statuses
+    
+    @staticmethod
+    def _get_box_statuses(level, player):
+        """
+        Status das caixas e ordem de desenho (agrupada por status), com cache.
+        Só recalcula quando as caixas mudam (level.version) ou o jogador muda
+        de célula ou de direção; uma caixa na frente está sempre a no máximo
+        1.5 unidades, então a posição contínua dentro da célula não importa.
+        
+        Args:
+            level: Objeto Level
+            player: Objeto Player
+            
+        Returns:
+            tuple: (np.ndarray de códigos de status, lista de índices de desenho)
+        """
+        dir_x, dir_z = player.get_facing_direction()
+        key = (id(level), level.version,
+               Physics.grid_round(player.x), Physics.grid_round(player.z), dir_x, dir_z)
+        
+        cached_key, statuses, order = Renderer._box_status_cache
+        if cached_key != key:
+            statuses = Renderer.compute_all_box_statuses(level.boxes_np, level.objectives_np, player, level)
+            order = np.argsort(statuses, kind='stable').tolist()
+            Renderer._box_status_cache = (key, statuses, order)
+        
+        return statuses, order
+    
+    @staticmethod
+    def compute_particle_sprites(particles, current_time):
+        """
+        Calcula alpha e tamanho de todas as partículas vivas de uma vez (NumPy).
+        
+        Args:
+            particles: Array (N, 11) de [x, y, z, vx, vy, vz, r, g, b, start_time, size]
+            current_time: Tempo atual
+            
+        Returns:
+            np.ndarray: (K, 8) com [x, y, z, r, g, b, alpha, size] por partícula viva
+        """
+        # float64: start_time é um timestamp grande demais para float32
+        data = np.asarray(particles, dtype=np.float64).reshape(len(particles), -1)
+        base_size = data[:, 10]
+        
+        age = current_time - data[:, 9]
+        alive = age < 4.0
+        
+        # Fade out suave e tamanho individual aumentado para visibilidade
+        alpha = 1.0 - age / 4.0
+        size = base_size * alpha * 1.2
+        
+        sprites = np.column_stack((data[:, 0:3], data[:, 6:9], alpha, size))
+        return sprites[alive]
+    
     @staticmethod
     def draw_particles(particles, current_time, camera_pos):
         """
         Desenha partículas de efeito.
         
         Args:
-            particles: Lista de [x, y, z, vx, vy, vz, r, g, b, start_time, size]
+            particles: Array (N, 11) de [x, y, z, vx, vy, vz, r, g, b, start_time, size]
             current_time: Tempo atual
             camera_pos: Posição da câmera (x, y, z)
         """
-        if not particles:
+        if len(particles) == 0:
             return
 
         glDisable(GL_LIGHTING)
@@ -237,27 +424,9 @@ class Renderer:
         glEnable(GL_BLEND)
         glBlendFunc(GL_SRC_ALPHA, GL_ONE)
         
-        for p in particles:
-            # p = [x, y, z, vx, vy, vz, r, g, b, start_time, size]
-            x, y, z = p[0], p[1], p[2]
-            r, g, b = p[6], p[7], p[8]
-            start_time = p[9]
-            base_size = p[10] if len(p) > 10 else 0.5  # Tamanho individual
-            
-            age = current_time - start_time
-            if age < 4.0:
-                # Fade out mais suave
-                alpha = 1.0 - (age / 4.0)
-                
-                # Usa tamanho individual da partícula, aumentado para melhor visibilidade
-                size = base_size * alpha * 1.2  # Multiplicador extra para visibilidade
-                
-                Primitives.draw_textured_particle(
-                    x, y, z, 
-                    size, 
-                    (r, g, b, alpha), 
-                    camera_pos
-                )
+        # Todas as partículas vivas num único draw
+        sprites = Renderer.compute_particle_sprites(particles, current_time)
+        Primitives.draw_textured_particles(sprites, camera_pos)
         
         # Restaura estados
         glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
@@ -276,41 +445,40 @@ class Renderer:
             sound_manager: Gerenciador de som
         """
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+        GLState.reset()
         
         # Configura câmera
         Renderer.setup_camera(player)
         
         # Desenha nuvens (no fundo, antes de tudo)
-        if hasattr(level, 'clouds') and level.clouds:
-            level.clouds.render((player.x, player.y, player.z))
-        
-        # Desenha chão
-        TextureManager().bind('floor')
-        Primitives.draw_floor()
-        TextureManager().bind(None)
+        if level.render_clouds:
+            level.render_clouds((player.x, player.y, player.z))
         
-        # Desenha paredes
-        for (x, y, z) in level.walls:
-            Renderer.draw_wall(x, y, z)
+        # Desenha chão e paredes (geometria estática)
+        Renderer._render_static_scene(level)
         
         # Desenha objetivos
-        for (x, y, z) in level.objectives:
-            Primitives.draw_target_marker(x, y, z)
+        Renderer.draw_target_markers(level)
         
-        # Desenha caixas com sombras
-        for (x, y, z) in level.boxes:
-            status = Renderer.get_box_status((x, y, z), level.objectives, player, level)
-            Renderer.draw_box(x, y, z, status)
-            Primitives.draw_shadow(x, y, z)
+        # Desenha caixas (ordenadas por status para agrupar materiais)
+        statuses, order = Renderer._get_box_statuses(level, player)
+        for i in order:
+            x, y, z = level.boxes[i]
+            Renderer.draw_box(x, y, z, Renderer.BOX_STATUSES[statuses[i]])
+        
+        # Sombras de todas as caixas num único draw
+        Primitives.draw_shadows(level.boxes_np)
         
         # Desenha partículas
         camera_pos = (player.x, player.y, player.z)
-        Renderer.draw_particles(level.particles, current_time, camera_pos)
+        Renderer.draw_particles(level.get_active_particles(), current_time, camera_pos)
         
-        # Desenha HUD
+        # Desenha HUD (uma única passada 2D)
         stats = level.get_progress_stats()
+        UI.begin_2d()
         UI.draw_hud(level.current_level_index, stats, sound_manager)
         UI.draw_crosshair()
+        UI.end_2d()
     
     @staticmethod
     def render_menu_background():
@@ -323,42 +491,51 @@ class Renderer:
         glRotatef(30, 0, 1, 0)
         glTranslatef(-2, -1, -8)
         
-        glEnable(GL_LIGHTING)
-        
-        # Chão de demonstração
-        glDisable(GL_LIGHTING)
-        glColor3f(0.2, 0.7, 0.2)
-        glPushMatrix()
-        glTranslatef(0, -1, 0)
-        glScalef(8, 0.02, 6)
-        
-        hs = 0.5
-        glBegin(GL_QUADS)
-        glVertex3f(-hs, hs, -hs)
-        glVertex3f(-hs, hs, hs)
-        glVertex3f(hs, hs, hs)
-        glVertex3f(hs, hs, -hs)
-        glEnd()
-        glPopMatrix()
-        
-        glEnable(GL_LIGHTING)
-        
-        # Parede de demonstração
-        Materials.apply_wall_material_varied(1, 1)
-        glPushMatrix()
-        glTranslatef(2, 0, 0)
-        glScalef(1, 2, 1)
-        Primitives.draw_unit_cube()
-        glPopMatrix()
+        # Cenário estático compilado uma vez
+        if Renderer._menu_background_list is None:
+            Primitives.create_cube_vbo()
+            
+            Renderer._menu_background_list = glGenLists(1)
+            glNewList(Renderer._menu_background_list, GL_COMPILE)
+            
+            # Chão de demonstração
+            glDisable(GL_LIGHTING)
+            glColor3f(0.2, 0.7, 0.2)
+            glPushMatrix()
+            glTranslatef(0, -1, 0)
+            glScalef(8, 0.02, 6)
+            
+            hs = 0.5
+            glBegin(GL_QUADS)
+            glVertex3f(-hs, hs, -hs)
+            glVertex3f(-hs, hs, hs)
+            glVertex3f(hs, hs, hs)
+            glVertex3f(hs, hs, -hs)
+            glEnd()
+            glPopMatrix()
+            
+            glEnable(GL_LIGHTING)
+            
+            # Parede de demonstração
+            Materials.apply_wall_material_varied(1, 1)
+            glPushMatrix()
+            glTranslatef(2, 0, 0)
+            glScalef(1, 2, 1)
+            Primitives.draw_unit_cube()
+            glPopMatrix()
+            
+            # Caixa de demonstração
+            glPushMatrix()
+            glTranslatef(0, -0.5, 0)
+            Materials.apply_box_material((0.72, 0.48, 0.16, 1.0), 32.0)
+            Primitives.draw_unit_cube()
+            glPopMatrix()
+            
+            glEndList()
         
-        # Caixa de demonstração
-        glPushMatrix()
-        glTranslatef(0, -0.5, 0)
-        Materials.apply_box_material((0.72, 0.48, 0.16, 1.0), 32.0)
-        Primitives.draw_unit_cube()
-        glPopMatrix()
+        glCallList(Renderer._menu_background_list)
         
-        # Objetivo de demonstração
+        # Objetivo de demonstração (dinâmico: pulsa com o tempo)
         Primitives.draw_target_marker(-1, 0, 0)
     
     @staticmethod
@@ -367,7 +544,9 @@ class Renderer:
         Renderiza menu de configurações.
         """
         Renderer.render_menu_background()
+        UI.begin_2d()
         UI.draw_settings_menu(selected_option, music_vol, sfx_vol, sensitivity, mouse_pos)
+        UI.end_2d()
 
     @staticmethod
     def render_menu(sound_manager=None, mouse_pos=(0,0)):
@@ -379,7 +558,9 @@ class Renderer:
             mouse_pos: Posição do mouse
         """
         Renderer.render_menu_background()
+        UI.begin_2d()
         UI.draw_menu(sound_manager, mouse_pos)
+        UI.end_2d()
     
     @staticmethod
     def render_victory(level, player, current_time):
@@ -393,32 +574,46 @@ class Renderer:
         """
         # Renderiza cena de fundo
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+        GLState.reset()
         Renderer.setup_camera(player)
         
-        Primitives.draw_floor()
-        
-        for (x, y, z) in level.walls:
-            Renderer.draw_wall(x, y, z)
+        Renderer._render_static_scene(level)
         
-        for (x, y, z) in level.objectives:
-            Primitives.draw_target_marker(x, y, z)
+        Renderer.draw_target_markers(level)
         
         for (x, y, z) in level.boxes:
             Renderer.draw_box(x, y, z, 'on_target')
-            Primitives.draw_shadow(x, y, z)
+        Primitives.draw_shadows(level.boxes_np)
         
         camera_pos = (player.x, player.y, player.z)
-        Renderer.draw_particles(level.particles, current_time, camera_pos)
+        Renderer.draw_particles(level.get_active_particles(), current_time, camera_pos)
         
         # Overlay de vitória
+        UI.begin_2d()
         UI.draw_victory_screen(level.move_count)
+        UI.end_2d()
     
     @staticmethod
     def render_final_victory():
         """Renderiza tela de vitória final"""
+        UI.begin_2d()
         UI.draw_final_victory_screen()
+        UI.end_2d()
     
     @staticmethod
     def cleanup():
         """Limpa recursos de renderização"""
+        for scene_list in Renderer._static_scenes.values():
+            glDeleteLists(scene_list, 1)
+        Renderer._static_scenes.clear()
+        
+        for batch in Renderer._marker_batches.values():
+            glDeleteBuffers(1, [batch[0]])
+        Renderer._marker_batches.clear()
+        
+        if Renderer._menu_background_list is not None:
+            glDeleteLists(Renderer._menu_background_list, 1)
+            Renderer._menu_background_list = None
+        
         Primitives.cleanup()
+        UI.cleanup()
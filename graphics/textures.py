@@ -5,14 +5,183 @@ Gerenciador de texturas do jogo.
 Suporta carregamento de imagens e geração procedural (fallback).
 """
 
+import functools
+import sys
 import pygame
+import numpy as np
 from OpenGL.GL import *
+from OpenGL.GL.EXT.texture_filter_anisotropic import (
+    GL_TEXTURE_MAX_ANISOTROPY_EXT, GL_MAX_TEXTURE_MAX_ANISOTROPY_EXT,
+    glInitTextureFilterAnisotropicEXT
+)
+
+# Limite de filtragem anisotrópica usado nas texturas de cena
+MAX_ANISOTROPY = 8.0
+
+# Geradores procedurais: um por textura, cada um retorna RGB (height, width, 3) int16
+# sem clamp final. Linhas = y, colunas = x (mesma ordem do buffer enviado ao OpenGL).
+
+# Octavas do value noise: (células na grade, peso)
+NOISE_OCTAVES = ((4, 0.5), (8, 0.3), (16, 0.2))
+
+
+def _value_noise(rng, height, width, amplitude):
+    """
+    Value noise fractal e repetível (tileable) em toda a grade, sem laços Python.
+    
+    Valores da rede vêm de uma tabela de permutação (hash de inteiros); entre os
+    nós a interpolação é bilinear com suavização smoothstep.
+    
+    Returns:
+        np.ndarray: Ruído int16 (height, width) em [-amplitude, amplitude]
+    """
+    perm = rng.permutation(256)
+    total = np.zeros((height, width), dtype=np.float32)
+    
+    for cells, weight in NOISE_OCTAVES:
+        fy = np.arange(height, dtype=np.float32) * cells / height
+        fx = np.arange(width, dtype=np.float32) * cells / width
+        y0 = fy.astype(np.int32)
+        x0 = fx.astype(np.int32)
+        ty = fy - y0
+        tx = fx - x0
+        ty = (ty * ty * (3 - 2 * ty))[:, None]
+        tx = (tx * tx * (3 - 2 * tx))[None, :]
+        
+        # Vizinhos com wrap para a textura repetir sem emenda
+        y1 = (y0 + 1) % cells
+        x1 = (x0 + 1) % cells
+        
+        def lattice(yi, xi):
+            h = perm[(perm[xi[None, :] & 255] + yi[:, None]) & 255]
+            return h.astype(np.float32) / 127.5 - 1.0
+        
+        top = lattice(y0, x0) + (lattice(y0, x1) - lattice(y0, x0)) * tx
+        bottom = lattice(y1, x0) + (lattice(y1, x1) - lattice(y1, x0)) * tx
+        total += weight * (top + (bottom - top) * ty)
+    
+    # Normaliza para ocupar toda a faixa (a soma de octavas raramente chega a ±1)
+    total /= max(float(np.abs(total).max()), 1e-6)
+    return np.rint(total * amplitude).astype(np.int16)
+
+
+def _floor_pixels(rng, height, width):
+    """Grama: Variações de verde com ruído"""
+    noise = _value_noise(rng, height, width, 20)
+    # Base verde grama (RGB aprox: 60, 160, 60)
+    return np.array((60, 160, 60), dtype=np.int16) + noise[..., None]
+
+
+def _wall_pixels(rng, height, width):
+    """Concreto: Cinza Claro (Mais claro como solicitado)"""
+    noise = _value_noise(rng, height, width, 20)
+    # Base cinza mais clara (antes era 140)
+    gray = np.clip(190 + noise, 0, 255)
+    rgb = np.repeat(gray[..., None], 3, axis=-1)
+    
+    # Detalhe: Manchas ocasionais (poros do concreto)
+    pores = rng.random((height, width)) > 0.98
+    rgb[pores] -= 30
+    return rgb
+
+
+@functools.lru_cache(maxsize=None)
+def _box_masks(height, width):
+    """
+    Máscaras fixas da textura de caixa, calculadas uma vez por tamanho.
+    
+    Returns:
+        tuple: (tábuas, borda, diagonais) como arrays bool (height, width)
+    """
+    y, x = np.mgrid[0:height, 0:width]
+    # Linhas das tábuas (a cada 16 pixels)
+    planks = y % 16 == 0
+    border = (x < 2) | (x > width - 3) | (y < 2) | (y > height - 3)
+    diagonal = (np.abs(x - y) < 2) | (np.abs(x - (height - y)) < 2)
+    for mask in (planks, border, diagonal):
+        mask.setflags(write=False)
+    return planks, border, diagonal
+
+
+def _box_pixels(rng, height, width):
+    """Madeira: Marrom com linhas horizontais (tábuas)"""
+    planks, border, diagonal = _box_masks(height, width)
+    noise = _value_noise(rng, height, width, 15)
+    rgb = np.clip(np.array((180, 120, 60), dtype=np.int16) + noise[..., None], 0, 255)
+    
+    # Linhas das tábuas
+    rgb[planks] -= 50
+    
+    # Borda reforçada da caixa
+    rgb[border] = (120, 80, 40)
+    
+    # Diagonal simples para reforço visual
+    rgb[diagonal] -= 20
+    return rgb
+
+
+def _surface_to_rgba(surface):
+    """
+    Converte uma Surface 32 bits em array RGBA (height, width, 4) para o OpenGL.
+    Lê o buffer da Surface direto (get_view), sem serializar como tostring,
+    reordenando os canais conforme get_shifts e invertendo as linhas (origem GL).
+    """
+    width, height = surface.get_size()
+    raw = np.frombuffer(surface.get_view('1'), dtype=np.uint8)
+    raw = raw.reshape(height, surface.get_pitch())[:, :width * 4].reshape(height, width, 4)
+    
+    # Deslocamento em bits de cada canal -> índice do byte no pixel
+    order = [shift // 8 for shift in surface.get_shifts()]
+    if sys.byteorder == 'big':
+        order = [3 - i for i in order]
+    
+    return np.ascontiguousarray(raw[::-1][..., order])
+
+
+def _is_software_renderer():
+    """
+    True em rasterizadores por CPU (llvmpipe, softpipe, SwiftShader...), onde
+    cada amostra anisotrópica extra custa tempo de CPU em vez de banda de GPU.
+    """
+    renderer = glGetString(GL_RENDERER) or b''
+    renderer = renderer.decode(errors='ignore').lower()
+    return any(tag in renderer for tag in ('llvmpipe', 'softpipe', 'swiftshader', 'software'))
+
+
+def _apply_mipmaps():
+    """
+    Gera mipmaps da textura ligada e ativa filtragem trilinear/anisotrópica.
+    
+    Mantém GL_LINEAR se o contexto não expõe glGenerateMipmap (GL < 3.0).
+    """
+    if not bool(glGenerateMipmap):
+        return
+    glGenerateMipmap(GL_TEXTURE_2D)
+    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR_MIPMAP_LINEAR)
+    
+    if glInitTextureFilterAnisotropicEXT() and not _is_software_renderer():
+        max_aniso = glGetFloatv(GL_MAX_TEXTURE_MAX_ANISOTROPY_EXT)
+        glTexParameterf(GL_TEXTURE_2D, GL_TEXTURE_MAX_ANISOTROPY_EXT,
+                        min(MAX_ANISOTROPY, float(max_aniso)))
+
+
+# Gerador de pixels por nome de textura
+_PIXEL_FNS = {
+    'floor': _floor_pixels,
+    'wall': _wall_pixels,
+    'box': _box_pixels,
+}
+
 
 class TextureManager:
     """Gerenciador de texturas (Singleton)"""
     
     _instance = None
     
+    # Buffer de staging reutilizado por todas as texturas procedurais (64x64 RGB).
+    # glTexImage2D copia os dados na chamada, então reutilizar é seguro.
+    _scratch = np.empty((64, 64, 3), dtype=np.uint8)
+    
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(TextureManager, cls).__new__(cls)
@@ -27,6 +196,11 @@ class TextureManager:
             name: Nome identificador da textura
             filepath: Caminho do arquivo (opcional)
         """
+        # Já carregada: reutiliza o objeto de textura existente
+        existing = self.textures.get(name)
+        if existing is not None:
+            return existing
+        
         texture_id = glGenTextures(1)
         glBindTexture(GL_TEXTURE_2D, texture_id)
         
@@ -36,99 +210,45 @@ class TextureManager:
         glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_REPEAT)
         glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_REPEAT)
         
+        # Linhas sem padding (RGB procedural tem 3 bytes por pixel)
+        glPixelStorei(GL_UNPACK_ALIGNMENT, 1)
+        
         try:
             if filepath:
                 image = pygame.image.load(filepath).convert_alpha()
                 width, height = image.get_size()
-                image_data = pygame.image.tostring(image, "RGBA", 1)
-                
-                # Convert to ctypes array
-                import ctypes
-                c_image_data = (GLubyte * len(image_data)).from_buffer_copy(image_data)
+                pixels = _surface_to_rgba(image)
                 
-                glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, width, height, 0, GL_RGBA, GL_UNSIGNED_BYTE, c_image_data)
+                glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, width, height, 0, GL_RGBA, GL_UNSIGNED_BYTE, pixels)
             else:
                 raise Exception("No filepath provided")
         except:
             # Fallback: Textura procedural realista
             self._create_procedural_texture(name)
-            
+        
+        _apply_mipmaps()
+        
         self.textures[name] = texture_id
         return texture_id
     
     def _create_procedural_texture(self, name):
-        """Gera texturas procedurais mais realistas (noise-based)"""
-        width, height = 64, 64
-        data = bytearray(width * height * 4)
+        """Gera texturas procedurais mais realistas (noise-based, vetorizado com NumPy)"""
+        height, width = TextureManager._scratch.shape[:2]
+        rng = np.random.default_rng(42)  # Seed para consistência visual
         
-        import random
-        random.seed(42) # Seed para consistência visual
-
-        for y in range(height):
-            for x in range(width):
-                i = (y * width + x) * 4
-                
-                if name == 'floor':
-                    # Grama: Variações de verde com ruído
-                    noise = random.randint(-20, 20)
-                    # Base verde grama (RGB aprox: 60, 160, 60)
-                    r = max(0, min(255, 60 + noise))
-                    g = max(0, min(255, 160 + noise))
-                    b = max(0, min(255, 60 + noise))
-                
-                elif name == 'wall':
-                    # Concreto: Cinza Claro (Mais claro como solicitado)
-                    noise = random.randint(-20, 20)
-                    # Base cinza mais clara (antes era 140)
-                    gray = max(0, min(255, 190 + noise))
-                    r, g, b = gray, gray, gray
-                    
-                    # Detalhe: Manchas ocasionais (poros do concreto)
-                    if random.random() > 0.98:
-                        r = max(0, r - 30)
-                        g = max(0, g - 30)
-                        b = max(0, b - 30)
-                
-                elif name == 'box':
-                    # Madeira: Marrom com linhas horizontais (tábuas)
-                    # Base marrom madeira
-                    r, g, b = 180, 120, 60
-                    
-                    # Variação de ruído na madeira
-                    noise = random.randint(-15, 15)
-                    r = max(0, min(255, r + noise))
-                    g = max(0, min(255, g + noise))
-                    b = max(0, min(255, b + noise))
-                    
-                    # Linhas das tábuas (a cada 16 pixels)
-                    if y % 16 == 0:
-                        r = max(0, r - 50)
-                        g = max(0, g - 50)
-                        b = max(0, b - 50)
-                    
-                    # Borda reforçada da caixa
-                    if x < 2 or x > width-3 or y < 2 or y > height-3:
-                        r = 120; g = 80; b = 40
-                    
-                    # Diagonal simples para reforço visual
-                    if abs(x - y) < 2 or abs(x - (height - y)) < 2:
-                         r = max(0, r - 20)
-                         g = max(0, g - 20)
-                         b = max(0, b - 20)
-
-                else:
-                    # Fallback
-                    r, g, b = 255, 0, 255
-                
-                data[i] = int(r)
-                data[i+1] = int(g)
-                data[i+2] = int(b)
-                data[i+3] = 255
+        pixel_fn = _PIXEL_FNS.get(name)
+        if pixel_fn is not None:
+            rgb = pixel_fn(rng, height, width)
+        else:
+            # Fallback
+            rgb = np.broadcast_to(np.array((255, 0, 255), dtype=np.int16), (height, width, 3))
+        
+        # Texturas procedurais são opacas: RGB8 economiza o byte de alfa constante
+        # (o alfa amostrado vale 1.0, então draws com blending não mudam)
+        pixels = TextureManager._scratch
+        np.clip(rgb, 0, 255, out=pixels, casting='unsafe')
         
-        # Convert to ctypes array
-        import ctypes
-        c_data = (GLubyte * len(data)).from_buffer_copy(data)
-        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, width, height, 0, GL_RGBA, GL_UNSIGNED_BYTE, c_data)
+        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGB8, width, height, 0, GL_RGB, GL_UNSIGNED_BYTE, pixels)
 
     def get_texture(self, name):
         """Retorna ID da textura"""
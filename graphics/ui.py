@@ -5,187 +5,808 @@ Interface do usuário: HUD, menus, textos e crosshair.
 Renderização 2D sobre a cena 3D.
 """
 
+import functools
 import math
 import time
+import numpy as np
 from OpenGL.GL import *
-from OpenGL.GLU import *
 from OpenGL.GLUT import *
 from config import *
+from .font_atlas import FontAtlas
+from .gl_utils import GLState
+
+# Fontes GLUT do fallback por tamanho lógico (mesmas chaves do FontAtlas)
+_GLUT_FONTS = {18: GLUT_BITMAP_HELVETICA_18, 13: GLUT_BITMAP_8_BY_13}
+
+# Centro da tela nas coordenadas lógicas da UI (o glOrtho usa WINDOW_WIDTH x WINDOW_HEIGHT)
+_CX = WINDOW_WIDTH // 2
+_CY = WINDOW_HEIGHT // 2
+
+# Posições fixas das estrelas da tela de vitória final (geradas uma vez)
+_STAR_XY = np.random.default_rng(42).integers(
+    [50, 50], [WINDOW_WIDTH - 50, WINDOW_HEIGHT - 50], size=(100, 2), endpoint=True
+).astype(np.float32)
+_STAR_PHASE = np.arange(len(_STAR_XY), dtype=np.float32) * np.float32(0.1)
+# Buffers reaproveitados a cada frame para o brilho das estrelas
+_STAR_BRIGHTNESS = np.empty(len(_STAR_XY), dtype=np.float32)
+_STAR_COLORS = np.empty((len(_STAR_XY), 3), dtype=np.float32)
+
+# Quad de tela cheia (anti-horário) e cores do gradiente da vitória final
+_FULLSCREEN_QUAD = np.array([
+    (0, 0), (WINDOW_WIDTH, 0), (WINDOW_WIDTH, WINDOW_HEIGHT), (0, WINDOW_HEIGHT)
+], dtype=np.float32)
+_FINAL_GRADIENT = np.array([
+    (0.1, 0.05, 0.2), (0.1, 0.05, 0.2), (0.2, 0.1, 0.4), (0.2, 0.1, 0.4)
+], dtype=np.float32)
+
+# Fundo dos menus: mesma ordem de vértices do desenho original (topo -> base,
+# sentido horário) e cores do topo e da base do gradiente
+_MENU_BG_QUAD = np.array([
+    (0, WINDOW_HEIGHT), (WINDOW_WIDTH, WINDOW_HEIGHT), (WINDOW_WIDTH, 0), (0, 0)
+], dtype=np.float32)
+_MENU_GRADIENT = np.array([
+    (0.02, 0.05, 0.1), (0.02, 0.05, 0.1), (0.1, 0.2, 0.4), (0.1, 0.2, 0.4)
+], dtype=np.float32)
+_SETTINGS_GRADIENT = np.array([
+    (0.05, 0.1, 0.2), (0.05, 0.1, 0.2), (0.0, 0.0, 0.05), (0.0, 0.0, 0.05)
+], dtype=np.float32)
+
+# Cores da barra de progresso por faixa (< 50%, < 100%, completa):
+# (escura à esquerda, clara à direita), já com o alfa da barra
+_BAR_COLORS = tuple(
+    ((r * 0.7, g * 0.7, b * 0.7, 0.9), (r, g, b, 0.9))
+    for r, g, b in ((0.0, 0.6, 1.0), (0.0, 0.8, 0.9), (0.2, 1.0, 0.3))
+)
+
+# Substitutos para símbolos fora de Latin-1 (as fontes só têm códigos 0..255)
+_GLYPH_FALLBACKS = str.maketrans({
+    '🏆': 'Y', '╔': '+', '╗': '+', '╚': '+', '╝': '+',
+    '═': '=', '║': '|', '★': '*', '█': '#',
+})
+
+
+def _latin1_safe(text):
+    """Troca símbolos sem glifo por equivalentes ASCII; o resto vira '?'"""
+    text = text.translate(_GLYPH_FALLBACKS)
+    return text.encode('latin-1', 'replace').decode('latin-1')
+
+
+@functools.lru_cache(maxsize=256)
+def _latin1_bytes(text):
+    """Bytes Latin-1 do texto para glCallLists (memorizado por string)"""
+    return text.encode('latin-1', 'ignore')
+
+
+# Troféu da vitória final, convertido uma vez na carga do módulo
+_TROPHY_LINES = tuple(_latin1_safe(line) for line in (
+    "    🏆",
+    "  ╔═══╗",
+    "  ║ ★ ║",
+    "  ╚═══╝",
+    "   ███",
+))
+
+# Textos fixos das telas de vitória: (x, y, texto, tamanho, cor ou None)
+_VICTORY_TEXTS = (
+    (_CX - 100, _CY + 50, "PARABÉNS! LEVEL COMPLETO!", 24, None),
+    (_CX - 180, _CY - 50,
+     "Pressione ENTER para o Próximo Level / ESC para sair", 18, None),
+)
+_FINAL_TEXTS = (
+    (_CX - 80, WINDOW_HEIGHT - 100, "PARABÉNS!", 36, (1.0, 0.8, 0.0)),  # Dourado
+    (_CX - 180, WINDOW_HEIGHT - 150,
+     "VOCÊ CONQUISTOU TODOS OS DESAFIOS!", 20, (0.9, 0.9, 0.9)),
+    # Troféu ASCII
+    *((_CX - 30, _CY + (len(_TROPHY_LINES) - i) * 20, line, 14, None)
+      for i, line in enumerate(_TROPHY_LINES)),
+    # Instruções
+    (_CX - 150, 120, "Pressione ENTER para voltar ao menu", 14, (0.8, 0.8, 0.8)),
+    (_CX - 60, 100, "ou ESC para sair", 14, None),
+)
+
+
+def _star_brightness(t, out):
+    """
+    Brilho de todas as estrelas: 0.5 + 0.5 * |sin(3t + fase)|.
+    
+    Vetorizado e sem temporários: cada etapa escreve direto em `out`.
+    O ângulo é reduzido a [0, 2pi) antes de virar float32 para não
+    perder precisão com time.time() grande.
+    """
+    np.add(_STAR_PHASE, np.float32((t * 3) % (2 * math.pi)), out=out)
+    np.sin(out, out=out)
+    np.abs(out, out=out)
+    out *= 0.5
+    out += 0.5
+    return out
+
+
+def _crosshair_quads(size=12, thickness=2):
+    """Vértices das duas barras do crosshair (GL_QUADS)"""
+    cx, cy = _CX, _CY
+    half = thickness // 2
+    return np.array([
+        # Linha horizontal
+        (cx - size, cy - half), (cx + size, cy - half),
+        (cx + size, cy + half), (cx - size, cy + half),
+        # Linha vertical
+        (cx - half, cy - size), (cx + half, cy - size),
+        (cx + half, cy + size), (cx - half, cy + size),
+    ], dtype=np.float32)
+
+
+# Textos e cores do painel de áudio do HUD, indexados pelo estado (False/True)
+_MUSIC_LABELS = ("[X] Musica [M]", "[+] Musica [M]")
+_SFX_LABELS = ("[X] Sons   [N]", "[+] Sons   [N]")
+_AUDIO_STATUS = ("OFF", "ON")
+_AUDIO_COLORS = ((0.8, 0.4, 0.4), (0.5, 1.0, 0.5))
+
+# Definições dos botões e sliders dos menus (imutáveis)
+_MENU_BUTTONS = (
+    ("NOVO JOGO", "start", 0, 80),
+    ("CONTINUAR", "continue", 0, 20),
+    ("CONFIGURAÇÕES", "settings", 0, -50),
+    ("SAIR", "quit", 0, -120),
+)
+_PAUSE_BUTTONS = (
+    ("CONTINUAR", "resume", 0, 40),
+    ("SALVAR", "save", 0, -20),
+    ("CONFIGURACOES", "settings", 0, -80),
+    ("MENU PRINCIPAL", "main_menu", 0, -140),
+)
+_SETTINGS_SLIDERS = (
+    (0, "Volume Música", 0, 60, 300),
+    (1, "Volume Efeitos", 0, -20, 300),
+    (2, "Sensibilidade", 0, -100, 300),
+)
+_SETTINGS_BUTTONS = (
+    ("VOLTAR", "back", 0, -200),
+)
+
+
+def _hit_index(rects, mouse_x, mouse_y):
+    """
+    Índice do primeiro retângulo (x0, y0, x1, y1) que contém o ponto, ou -1.
+    
+    Laço comum a todos os menus; as ações ficam numa tupla paralela.
+    """
+    for i, (x0, y0, x1, y1) in enumerate(rects):
+        if x0 <= mouse_x <= x1 and y0 <= mouse_y <= y1:
+            return i
+    return -1
+
+
+@functools.lru_cache(maxsize=8)
+def _button_hitboxes(buttons, width, height, window_w, window_h):
+    """
+    Retângulos de clique dos botões.
+    
+    Memorizado pelo tamanho da janela; os eventos de mouse só comparam
+    inteiros em vez de refazer a aritmética a cada movimento.
+    
+    Returns:
+        tuple: (ações, retângulos (x0, y0, x1, y1)) em tuplas paralelas
+    """
+    cx = window_w // 2
+    cy = window_h // 2
+    actions = tuple(action for label, action, x_off, y_off in buttons)
+    rects = tuple(
+        (cx + x_off - width // 2, cy + y_off - height // 2,
+         cx + x_off + width // 2, cy + y_off + height // 2)
+        for label, action, x_off, y_off in buttons
+    )
+    return actions, rects
+
+
+def _border_rects(x0, y0, x1, y1, width):
+    """
+    Retângulos da borda de um contorno: base, topo, esquerda e direita.
+    
+    A espessura é arredondada para pixels inteiros e centrada no contorno,
+    como nas linhas largas sem antialiasing.
+    """
+    h = max(1, round(width)) / 2
+    return ((x0 - h, y0 - h, x1 + h, y0 + h),
+            (x0 - h, y1 - h, x1 + h, y1 + h),
+            (x0 - h, y0 + h, x0 + h, y1 - h),
+            (x1 - h, y0 + h, x1 + h, y1 - h))
+
+
+# Estilos dos botões por destaque: (fundo, borda, escala)
+_BUTTON_STYLES = (
+    ((0.2, 0.2, 0.2, 0.6), (0.6, 0.6, 0.6, 1.0), 1.0),   # Cinza escuro
+    ((0.3, 0.6, 1.0, 0.8), (1.0, 1.0, 1.0, 1.0), 1.05),  # Azul claro (hover)
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _button_geometry(x, y, width, height, highlighted):
+    """
+    Vértices e cores prontos do fundo e da borda de um botão.
+    
+    Memorizado: os botões dos menus só têm dois estados (normal e
+    destacado), então cada frame apenas estende o lote com tuplas prontas.
+    A escala do hover é aplicada direto nas coordenadas absolutas.
+    
+    Returns:
+        tuple: (posições (x, y, ...), cores RGBA) dos 5 quads
+    """
+    bg_color, border_color, scale = _BUTTON_STYLES[highlighted]
+    half_w = width // 2 * scale
+    half_h = height // 2 * scale
+    x0, y0, x1, y1 = x - half_w, y - half_h, x + half_w, y + half_h
+    
+    positions = []
+    for rx0, ry0, rx1, ry1 in ((x0, y0, x1, y1),) + _border_rects(x0, y0, x1, y1, 2.0):
+        positions.extend((rx0, ry0, rx1, ry0, rx1, ry1, rx0, ry1))
+    return tuple(positions), bg_color * 4 + border_color * 16
+
+
+@functools.lru_cache(maxsize=16)
+def _button_row_geometry(buttons, width, height, hit):
+    """
+    Fundo e borda de todos os botões de um menu, com o de índice `hit` destacado.
+    
+    Memorizado por menu e botão destacado: um frame de menu estende o lote
+    com uma única tupla pronta, na mesma ordem dos botões.
+    
+    Returns:
+        tuple: (posições (x, y, ...), cores RGBA) de todos os quads
+    """
+    positions = []
+    colors = []
+    for i, (label, action, x_off, y_off) in enumerate(buttons):
+        button_positions, button_colors = _button_geometry(
+            _CX + x_off, _CY + y_off, width, height, i == hit)
+        positions.extend(button_positions)
+        colors.extend(button_colors)
+    return tuple(positions), tuple(colors)
+
+
+@functools.lru_cache(maxsize=8)
+def _settings_hitboxes(window_w, window_h):
+    """
+    Retângulos dos sliders e do botão Voltar das configurações.
+    
+    Returns:
+        tuple: (retângulos dos sliders seguidos do Voltar,
+                (s_id, left, width) de cada slider)
+    """
+    cx = window_w // 2
+    cy = window_h // 2
+    height = 20
+    rects = []
+    sliders = []
+    for s_id, label, x_off, y_off, width in _SETTINGS_SLIDERS:
+        sx = cx + x_off
+        sy = cy + y_off
+        left = sx - width // 2
+        # Hitbox generosa para drag
+        rects.append((left - 10, sy - height // 2 - 10,
+                      sx + width // 2 + 10, sy + height // 2 + 10))
+        sliders.append((s_id, left, width))
+    # Botão Voltar: largura 120 (metade 60), altura 40
+    back_y = cy - 200
+    rects.append((cx - 60, back_y - 20, cx + 60, back_y + 20))
+    return tuple(rects), tuple(sliders)
+
+
+def _in_2d(draw_fn):
+    """
+    Garante o estado 2D em funções públicas de tela.
+    
+    Dentro de um UI.begin_2d() externo (caso normal do Renderer) o par
+    begin/end só mexe no contador de aninhamento; chamadas avulsas
+    continuam funcionando sozinhas.
+    """
+    @functools.wraps(draw_fn)
+    def wrapper(*args, **kwargs):
+        UI.begin_2d()
+        try:
+            return draw_fn(*args, **kwargs)
+        finally:
+            UI.end_2d()
+    return wrapper
+
+
+def _batched(draw_fn):
+    """
+    Agrupa a geometria e os textos desenhados pela função em poucos draws.
+    
+    Retângulos (bordas e linhas incluídas) e textos são coletados e enviados
+    ao final, nessa ordem: um único glDrawArrays para os quads e um por atlas
+    de fonte. Só serve para telas em que nada é coberto por um desenho
+    imediato posterior. Chamadas aninhadas usam o lote já aberto.
+    """
+    @functools.wraps(draw_fn)
+    def wrapper(*args, **kwargs):
+        if UI._text_batch is not None:
+            return draw_fn(*args, **kwargs)
+        UI._quad_batch = ([], [])
+        UI._text_batch = {}
+        try:
+            return draw_fn(*args, **kwargs)
+        finally:
+            UI._flush_batches()
+    return wrapper
 
 
 class UI:
     """Gerenciador de interface do usuário"""
     
+    _2d_depth = 0
+    
+    # VBOs estáticos da interface (criados no primeiro begin_2d)
+    _fullscreen_vbo = None
+    _final_gradient_vbo = None
+    _menu_bg_vbo = None
+    _menu_gradient_vbo = None
+    _settings_gradient_vbo = None
+    _crosshair_vbo = None
+    _star_vbo = None
+    _star_color_vbo = None
+    
+    # Display lists dos glifos GLUT por tamanho (fallback sem atlas)
+    _glut_list_bases = {}
+    
+    # Larguras dos glifos GLUT por tamanho (códigos 0..255)
+    _glut_widths = {}
+    
+    # Larguras de texto já medidas: (fonte, texto) -> pixels
+    _text_widths = {}
+    
+    # HUD inteiro numa display list, recompilada só quando a chave muda
+    # (nível, caixas, movimentos e estado do áudio)
+    _hud_list = None
+    _hud_list_key = None
+    
+    # True enquanto uma display list da interface está sendo compilada
+    # (draw_text não pode abrir outra lista nesse intervalo)
+    _compiling_list = False
+    
+    # Display list por posição de texto: (x, y, fonte) -> (texto, lista).
+    # Quando o texto de uma posição muda (ex.: contador de movimentos) a
+    # mesma lista é recompilada no lugar.
+    _text_lists = {}
+    _TEXT_LIST_LIMIT = 256
+    
+    # Lotes abertos por _batched (None fora de um lote):
+    #   quads: ([x, y, ...], [r, g, b, a, ...])
+    #   textos: {FontAtlas ou tamanho GLUT: [(x, y, texto)]}
+    _quad_batch = None
+    _text_batch = None
+    
+    # Buffers float32 reaproveitados pelo envio dos quads (posições e cores
+    # RGBA); só são realocados, com folga, quando um lote não cabe
+    _quad_positions = np.empty(2048, dtype=np.float32)
+    _quad_colors = np.empty(4096, dtype=np.float32)
+    
+    # Display lists com os textos fixos das telas de vitória (por tela)
+    _screen_lists = {}
+    
     @staticmethod
-    def draw_text(x, y, text, size=18):
+    def _create_vbos():
+        """Envia para a GPU a geometria fixa da interface"""
+        def upload(data, usage=GL_STATIC_DRAW):
+            vbo = glGenBuffers(1)
+            glBindBuffer(GL_ARRAY_BUFFER, vbo)
+            glBufferData(GL_ARRAY_BUFFER, data.nbytes, data, usage)
+            return vbo
+        
+        UI._fullscreen_vbo = upload(_FULLSCREEN_QUAD)
+        UI._final_gradient_vbo = upload(_FINAL_GRADIENT)
+        UI._menu_bg_vbo = upload(_MENU_BG_QUAD)
+        UI._menu_gradient_vbo = upload(_MENU_GRADIENT)
+        UI._settings_gradient_vbo = upload(_SETTINGS_GRADIENT)
+        UI._crosshair_vbo = upload(_crosshair_quads())
+        UI._star_vbo = upload(_STAR_XY)
+        UI._star_color_vbo = upload(
+            np.zeros((len(_STAR_XY), 3), dtype=np.float32), GL_DYNAMIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+    
+    @staticmethod
+    def _draw_vbo(vbo, mode, count, color_vbo=None):
         """
-        Desenha texto 2D na tela com sombra.
+        Desenha vértices 2D de um VBO com uma única chamada glDrawArrays.
         
         Args:
-            x, y: Posição na tela
-            text: Texto a ser desenhado
-            size: Tamanho da fonte
+            vbo: Buffer com posições (x, y) float32
+            mode: Primitiva OpenGL (GL_QUADS, GL_POINTS...)
+            count: Número de vértices
+            color_vbo: Buffer opcional com cores RGB float32 por vértice
+        """
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, vbo)
+        glVertexPointer(2, GL_FLOAT, 0, None)
+        if color_vbo is not None:
+            glEnableClientState(GL_COLOR_ARRAY)
+            glBindBuffer(GL_ARRAY_BUFFER, color_vbo)
+            glColorPointer(3, GL_FLOAT, 0, None)
+        
+        glDrawArrays(mode, 0, count)
+        
+        if color_vbo is not None:
+            glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+    
+    @staticmethod
+    def begin_2d():
+        """
+        Ativa projeção ortográfica 2D para a passada de interface.
+        
+        As funções draw_* assumem este estado; chamadas aninhadas apenas
+        incrementam um contador, então a troca ocorre uma vez por passada.
         """
+        UI._2d_depth += 1
+        if UI._2d_depth > 1:
+            return
+        
+        if UI._fullscreen_vbo is None:
+            UI._create_vbos()
+        
+        # A cena 3D altera estado com chamadas diretas; o cache recomeça aqui
+        GLState.reset()
+        
         glMatrixMode(GL_PROJECTION)
         glPushMatrix()
         glLoadIdentity()
-        gluOrtho2D(0, WINDOW_WIDTH, 0, WINDOW_HEIGHT)
+        glOrtho(0, WINDOW_WIDTH, 0, WINDOW_HEIGHT, -1, 1)
         glMatrixMode(GL_MODELVIEW)
         glPushMatrix()
         glLoadIdentity()
         
-        glDisable(GL_LIGHTING)
-        glDisable(GL_DEPTH_TEST)
+        GLState.disable(GL_LIGHTING)
+        GLState.disable(GL_DEPTH_TEST)
+        # Toda a interface é alpha-blended: o blending fica ligado na passada
+        GLState.enable(GL_BLEND)
+        GLState.blend_func(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+    
+    @staticmethod
+    def end_2d():
+        """Restaura projeção 3D, iluminação e depth test após a interface"""
+        UI._2d_depth -= 1
+        if UI._2d_depth > 0:
+            return
+        
+        GLState.enable(GL_DEPTH_TEST)
+        GLState.enable(GL_LIGHTING)
+        GLState.disable(GL_BLEND)
+        
+        glPopMatrix()
+        glMatrixMode(GL_PROJECTION)
+        glPopMatrix()
+        glMatrixMode(GL_MODELVIEW)
+    
+    @staticmethod
+    def _glut_font_lists(size):
+        """
+        Retorna a base das display lists dos glifos GLUT (compiladas uma vez).
+        
+        Args:
+            size: Tamanho lógico da fonte (>= 18 usa Helvetica 18)
+        
+        Returns:
+            int: Base para glListBase (lista base + código = glifo)
+        """
+        key = 18 if size >= 18 else 13
+        base = UI._glut_list_bases.get(key)
+        if base is None:
+            font = _GLUT_FONTS[key]
+            base = glGenLists(256)
+            for code in range(256):
+                glNewList(base + code, GL_COMPILE)
+                if code:
+                    glutBitmapCharacter(font, code)
+                glEndList()
+            UI._glut_list_bases[key] = base
+        return base
+    
+    @staticmethod
+    def draw_text(x, y, text, size=18):
+        """
+        Desenha texto 2D na tela com sombra.
+        
+        Args:
+            x, y: Posição na tela
+            text: Texto a ser desenhado
+            size: Tamanho da fonte
+        """
+        if UI._text_batch is not None:
+            font = FontAtlas.for_size(size) or (18 if size >= 18 else 13)
+            UI._text_batch.setdefault(font, []).append((x, y, text))
+            return
+        
+        if UI._compiling_list:
+            # Dentro de outra lista: emite direto, sem lista própria
+            UI._emit_text(x, y, text, *UI._text_font(size))
+            return
+        
+        font_key = 18 if size >= 18 else 13
+        slot = (x, y, font_key)
+        entry = UI._text_lists.get(slot)
+        if entry is not None and entry[0] == text:
+            glCallList(entry[1])
+            return
+        
+        atlas, list_base = UI._text_font(size)
+        if entry is None:
+            if len(UI._text_lists) >= UI._TEXT_LIST_LIMIT:
+                UI._clear_text_lists()
+            list_id = glGenLists(1)
+        else:
+            list_id = entry[1]
+        
+        glNewList(list_id, GL_COMPILE_AND_EXECUTE)
+        UI._emit_text(x, y, text, atlas, list_base)
+        glEndList()
+        UI._text_lists[slot] = (text, list_id)
+    
+    @staticmethod
+    def _text_font(size):
+        """
+        Prepara a fonte de um tamanho para uso dentro de glNewList.
+        
+        Atlas e listas de glifos precisam existir antes do glNewList
+        (texturas e outras listas não podem ser criadas durante a compilação).
+        
+        Returns:
+            tuple: (FontAtlas ou None, base das listas GLUT ou 0)
+        """
+        atlas = FontAtlas.for_size(size)
+        list_base = UI._glut_font_lists(size) if atlas is None else 0
+        return atlas, list_base
+    
+    @staticmethod
+    def _emit_text(x, y, text, atlas, list_base):
+        """Envia os comandos de desenho do texto com sombra (sem cache)"""
+        if atlas is not None:
+            # Sombra e texto em lotes de quads texturizados
+            atlas.draw(x, y, text)
+            return
+        
+        # Fallback GLUT: uma display list por glifo, uma chamada por string
+        # (GLUT ignora caracteres acima de 255, assim como o encode abaixo)
+        glListBase(list_base)
+        codes = _latin1_bytes(text)
         
         # Sombra (preto)
         glColor3f(0.0, 0.0, 0.0)
         glRasterPos2f(x + 1, y - 1)
-        font = GLUT_BITMAP_HELVETICA_18 if size >= 18 else GLUT_BITMAP_8_BY_13
-        for ch in text:
-            glutBitmapCharacter(font, ord(ch))
+        glCallLists(len(codes), GL_UNSIGNED_BYTE, codes)
         
         # Texto (branco)
         glColor3f(1.0, 1.0, 1.0)
         glRasterPos2f(x, y)
-        for ch in text:
-            glutBitmapCharacter(font, ord(ch))
+        glCallLists(len(codes), GL_UNSIGNED_BYTE, codes)
+        glListBase(0)
+    
+    @staticmethod
+    def _clear_text_lists():
+        """Libera as display lists de texto em cache"""
+        for text, list_id in UI._text_lists.values():
+            glDeleteLists(list_id, 1)
+        UI._text_lists.clear()
+    
+    @staticmethod
+    def _draw_static_texts(key, texts):
+        """
+        Desenha textos fixos de uma tela a partir de uma display list própria.
         
-        glEnable(GL_DEPTH_TEST)
-        glEnable(GL_LIGHTING)
+        A lista é compilada na primeira chamada com todos os textos (e cores)
+        da tela, e depois reproduzida com um único glCallList.
         
-        glPopMatrix()
-        glMatrixMode(GL_PROJECTION)
-        glPopMatrix()
-        glMatrixMode(GL_MODELVIEW)
+        Args:
+            key: Nome da tela (chave do cache)
+            texts: Tupla de (x, y, texto, tamanho, cor RGB ou None)
+        """
+        list_id = UI._screen_lists.get(key)
+        if list_id is None:
+            fonts = [UI._text_font(size) for x, y, text, size, color in texts]
+            list_id = glGenLists(1)
+            glNewList(list_id, GL_COMPILE)
+            for (x, y, text, size, color), (atlas, list_base) in zip(texts, fonts):
+                if color is not None:
+                    glColor3f(*color)
+                UI._emit_text(x, y, text, atlas, list_base)
+            glEndList()
+            UI._screen_lists[key] = list_id
+        glCallList(list_id)
     
     @staticmethod
+    @_in_2d
     def draw_crosshair():
         """Desenha crosshair no centro da tela"""
-        glDisable(GL_LIGHTING)
-        glDisable(GL_DEPTH_TEST)
-        
-        glMatrixMode(GL_PROJECTION)
-        glPushMatrix()
-        glLoadIdentity()
-        gluOrtho2D(0, WINDOW_WIDTH, 0, WINDOW_HEIGHT)
-        glMatrixMode(GL_MODELVIEW)
-        glPushMatrix()
-        glLoadIdentity()
-        
-        cx = WINDOW_WIDTH // 2
-        cy = WINDOW_HEIGHT // 2
-        size = 12
-        thickness = 2
-        
-        glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
         glColor4f(1.0, 1.0, 1.0, 0.8)
         
-        # Linha horizontal
-        glBegin(GL_QUADS)
-        glVertex2f(cx - size, cy - thickness//2)
-        glVertex2f(cx + size, cy - thickness//2)
-        glVertex2f(cx + size, cy + thickness//2)
-        glVertex2f(cx - size, cy + thickness//2)
-        glEnd()
-        
-        # Linha vertical
-        glBegin(GL_QUADS)
-        glVertex2f(cx - thickness//2, cy - size)
-        glVertex2f(cx + thickness//2, cy - size)
-        glVertex2f(cx + thickness//2, cy + size)
-        glVertex2f(cx - thickness//2, cy + size)
-        glEnd()
+        # Linhas horizontal e vertical num único draw
+        UI._draw_vbo(UI._crosshair_vbo, GL_QUADS, 8)
+    
+    @staticmethod
+    def _push_quad(x0, y0, x1, y1, colors):
+        """
+        Adiciona um retângulo ao lote aberto (mesma ordem de vértices do glRectf).
         
-        glDisable(GL_BLEND)
-        glEnable(GL_DEPTH_TEST)
-        glEnable(GL_LIGHTING)
+        Args:
+            x0, y0, x1, y1: Cantos do retângulo
+            colors: RGBA único ou tupla com as 4 cores RGBA dos vértices
+                (a passada 2D é toda com blending; alfa 1.0 é opaco)
+        """
+        positions, vertex_colors = UI._quad_batch
+        positions.extend((x0, y0, x1, y0, x1, y1, x0, y1))
+        if len(colors) == 4 and isinstance(colors[0], tuple):
+            for color in colors:
+                vertex_colors.extend(color)
+        else:
+            vertex_colors.extend(colors * 4)
+    
+    @staticmethod
+    def _push_border(x0, y0, x1, y1, color, width):
+        """
+        Adiciona a borda de um retângulo como quatro quads finos.
         
-        glPopMatrix()
-        glMatrixMode(GL_PROJECTION)
-        glPopMatrix()
-        glMatrixMode(GL_MODELVIEW)
+        Substitui o GL_LINE_LOOP com glLineWidth: a borda vai no mesmo lote
+        dos retângulos e a espessura de linha nunca muda.
+        """
+        for rect in _border_rects(x0, y0, x1, y1, width):
+            UI._push_quad(*rect, color)
+    
+    @staticmethod
+    def _push_geometry(positions, colors):
+        """Adiciona quads já montados (posições e cores por vértice) ao lote"""
+        batch_positions, batch_colors = UI._quad_batch
+        batch_positions.extend(positions)
+        batch_colors.extend(colors)
+    
+    @staticmethod
+    def _draw_color_arrays(positions, colors):
+        """Desenha quads de listas de posições (x, y) e cores RGBA"""
+        count = len(positions)
+        if count > len(UI._quad_positions):
+            size = max(count, 2 * len(UI._quad_positions))
+            UI._quad_positions = np.empty(size, dtype=np.float32)
+            UI._quad_colors = np.empty(2 * size, dtype=np.float32)
+        UI._quad_positions[:count] = positions
+        UI._quad_colors[:2 * count] = colors
+        glVertexPointer(2, GL_FLOAT, 0, UI._quad_positions)
+        glColorPointer(4, GL_FLOAT, 0, UI._quad_colors)
+        glDrawArrays(GL_QUADS, 0, count // 2)
+    
+    @staticmethod
+    def _flush_batches():
+        """Fecha os lotes abertos por _batched e envia tudo ao OpenGL"""
+        quads, texts = UI._quad_batch, UI._text_batch
+        UI._quad_batch = UI._text_batch = None
+        
+        positions, colors = quads
+        if positions:
+            glEnableClientState(GL_VERTEX_ARRAY)
+            glEnableClientState(GL_COLOR_ARRAY)
+            UI._draw_color_arrays(positions, colors)
+            glDisableClientState(GL_COLOR_ARRAY)
+            glDisableClientState(GL_VERTEX_ARRAY)
+        
+        # Textos por último (ficam sobre a geometria do lote)
+        for font, items in texts.items():
+            if isinstance(font, FontAtlas):
+                font.draw_batch(items)
+            else:
+                for x, y, text in items:
+                    UI.draw_text(x, y, text, font)
     
     @staticmethod
+    @_batched
     def draw_panel(x, y, width, height, alpha=0.75):
         """Desenha painel glassmorphism."""
-        glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
-        glColor4f(0.04, 0.08, 0.16, alpha)
-        glBegin(GL_QUADS)
-        glVertex2f(x, y)
-        glVertex2f(x + width, y)
-        glVertex2f(x + width, y + height)
-        glVertex2f(x, y + height)
-        glEnd()
-        glLineWidth(1.5)
-        glColor4f(0.4, 0.6, 1.0, 0.3)
-        glBegin(GL_LINE_LOOP)
-        glVertex2f(x, y)
-        glVertex2f(x + width, y)
-        glVertex2f(x + width, y + height)
-        glVertex2f(x, y + height)
-        glEnd()
-        glLineWidth(1.0)
-        glDisable(GL_BLEND)
+        UI._push_quad(x, y, x + width, y + height, (0.04, 0.08, 0.16, alpha))
+        UI._push_border(x, y, x + width, y + height, (0.4, 0.6, 1.0, 0.3), 1.5)
     
     @staticmethod
+    @_batched
     def draw_progress_bar(x, y, width, height, progress, max_val=1.0):
         """Desenha barra de progresso."""
         norm = min(1.0, max(0.0, progress / max_val))
-        glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
-        glColor4f(0.2, 0.2, 0.25, 0.6)
-        glBegin(GL_QUADS)
-        glVertex2f(x, y)
-        glVertex2f(x + width, y)
-        glVertex2f(x + width, y + height)
-        glVertex2f(x, y + height)
-        glEnd()
+        UI._push_quad(x, y, x + width, y + height, (0.2, 0.2, 0.25, 0.6))
         if norm > 0:
             fw = width * norm
-            r = 0.2 if norm >= 1.0 else 0.0
-            g = 1.0 if norm >= 1.0 else (0.8 if norm >= 0.5 else 0.6)
-            b = 0.3 if norm >= 1.0 else (0.9 if norm >= 0.5 else 1.0)
-            glBegin(GL_QUADS)
-            glColor4f(r*0.7, g*0.7, b*0.7, 0.9)
-            glVertex2f(x, y)
-            glColor4f(r, g, b, 0.9)
-            glVertex2f(x + fw, y)
-            glVertex2f(x + fw, y + height)
-            glColor4f(r*0.7, g*0.7, b*0.7, 0.9)
-            glVertex2f(x, y + height)
-            glEnd()
-        glLineWidth(1.0)
-        glColor4f(0.5, 0.5, 0.6, 0.8)
-        glBegin(GL_LINE_LOOP)
-        glVertex2f(x, y)
-        glVertex2f(x + width, y)
-        glVertex2f(x + width, y + height)
-        glVertex2f(x, y + height)
-        glEnd()
-        glDisable(GL_BLEND)
+            dark, bright = _BAR_COLORS[(norm >= 0.5) + (norm >= 1.0)]
+            UI._push_quad(x, y, x + fw, y + height, (dark, bright, bright, dark))
+        UI._push_border(x, y, x + width, y + height, (0.5, 0.5, 0.6, 0.8), 1.0)
+    
+    @staticmethod
+    def _hud_texts(level_index, stats):
+        """
+        Formata as strings do HUD (só chamado quando a lista do HUD é refeita).
+        
+        Args:
+            level_index: Índice do nível atual
+            stats: Dict com estatísticas (boxes_on_target, total_boxes, move_count)
+        
+        Returns:
+            dict: Textos prontos (level, boxes, pct, moves, tip, tip_color)
+        """
+        on_target = stats['boxes_on_target']
+        total = stats['total_boxes']
+        texts = {
+            'level': f"* NIVEL {level_index + 1}",
+            'boxes': f"[] Caixas: {on_target}/{total}",
+            'pct': f"{int((on_target / total) * 100)}%" if total > 0 else None,
+            'moves': f"# Movimentos: {stats['move_count']}",
+        }
+        
+        # Dica contextual
+        if on_target == 0:
+            texts['tip'] = "! Dica: Empurre as caixas para os alvos vermelhos!"
+            texts['tip_color'] = (1.0, 0.8, 0.3)
+        elif on_target < total:
+            texts['tip'] = f"! Continue! Faltam {total - on_target} caixas"
+            texts['tip_color'] = (0.6, 0.9, 1.0)
+        else:
+            texts['tip'] = "** Perfeito! Todas as caixas no lugar!"
+            texts['tip_color'] = (0.5, 1.0, 0.5)
+        
+        return texts
     
     @staticmethod
+    @_in_2d
     def draw_hud(level_index, stats, sound_manager=None):
         """
         Desenha HUD principal do jogo com visual moderno.
         
+        Em frames sem mudança de estatísticas ou de áudio o HUD inteiro é
+        uma única chamada glCallList.
+        
+        Não deve ser chamado sob telas opacas (vitória, vitória final, menus):
+        todo pixel seria coberto pelo overlay. Só o pause, cujo fundo é
+        translúcido, mantém o HUD visível por baixo.
+        
         Args:
             level_index: Índice do nível atual
             stats: Dict com estatísticas (boxes_on_target, total_boxes, move_count)
             sound_manager: Gerenciador de som para mostrar status
         """
-        # Setup ortho 2D
-        glMatrixMode(GL_PROJECTION)
-        glPushMatrix()
-        glLoadIdentity()
-        gluOrtho2D(0, WINDOW_WIDTH, 0, WINDOW_HEIGHT)
-        glMatrixMode(GL_MODELVIEW)
-        glPushMatrix()
-        glLoadIdentity()
-        glDisable(GL_LIGHTING)
-        glDisable(GL_DEPTH_TEST)
+        key = (level_index, stats['boxes_on_target'], stats['total_boxes'],
+               stats['move_count'],
+               sound_manager.music_enabled if sound_manager else None,
+               sound_manager.sfx_enabled if sound_manager else None)
+        if key != UI._hud_list_key:
+            UI._compile_hud(level_index, stats, sound_manager)
+            UI._hud_list_key = key
+        glCallList(UI._hud_list)
+        # A lista altera estado sem passar pelo cache
+        GLState.reset()
+    
+    @staticmethod
+    def _compile_hud(level_index, stats, sound_manager):
+        """
+        Grava os comandos do HUD na display list do HUD.
+        
+        Usa GL_COMPILE seguido de glCallList: com GL_COMPILE_AND_EXECUTE o
+        Mesa acusa GL_INVALID_OPERATION em mudanças de estado depois de
+        glRectf seguido de glBegin/glEnd.
+        """
+        # Fontes criadas antes do glNewList; o cache de estado recomeça para
+        # que toda mudança de estado fique gravada na lista
+        UI._text_font(18)
+        UI._text_font(13)
+        if UI._hud_list is None:
+            UI._hud_list = glGenLists(1)
+        GLState.reset()
+        
+        UI._hud_list_key = None
+        UI._compiling_list = True
+        glNewList(UI._hud_list, GL_COMPILE)
+        try:
+            UI._draw_hud_contents(level_index, stats, sound_manager)
+        finally:
+            glEndList()
+            UI._compiling_list = False
+    
+    @staticmethod
+    @_batched
+    def _draw_hud_contents(level_index, stats, sound_manager):
+        """Comandos de desenho do HUD (gravados na display list do HUD)"""
+        texts = UI._hud_texts(level_index, stats)
         
         # === PAINEL SUPERIOR ESQUERDO: INFO DO NÍVEL ===
         panel_x = 15
@@ -200,13 +821,12 @@ class UI:
         
         # Nível
         glColor3f(1.0, 0.9, 0.2)  # Amarelo dourado
-        UI.draw_text(text_x, text_y, f"* NIVEL {level_index + 1}", 18)
+        UI.draw_text(text_x, text_y, texts['level'], 18)
         
         # Caixas
         text_y -= 28
         glColor3f(0.9, 0.9, 1.0)
-        UI.draw_text(text_x, text_y, 
-            f"[] Caixas: {stats['boxes_on_target']}/{stats['total_boxes']}", 16)
+        UI.draw_text(text_x, text_y, texts['boxes'], 16)
         
         # Barra de progresso
         text_y -= 24
@@ -216,16 +836,14 @@ class UI:
             stats['boxes_on_target'], stats['total_boxes'])
         
         # Porcentagem (na mesma linha, à direita)
-        if stats['total_boxes'] > 0:
-            pct = int((stats['boxes_on_target'] / stats['total_boxes']) * 100)
+        if texts['pct'] is not None:
             glColor3f(0.7, 0.8, 0.9)
-            pct_text = f"{pct}%"
-            UI.draw_text(bar_x + bar_w + 10, text_y - 2, pct_text, 14)
+            UI.draw_text(bar_x + bar_w + 10, text_y - 2, texts['pct'], 14)
         
         # Movimentos
         text_y -= 28
         glColor3f(0.9, 0.9, 1.0)
-        UI.draw_text(text_x, text_y, f"# Movimentos: {stats['move_count']}", 16)
+        UI.draw_text(text_x, text_y, texts['moves'], 16)
         
         # === PAINEL SUPERIOR DIREITO: CONTROLES DE ÁUDIO ===
         if sound_manager:
@@ -239,23 +857,19 @@ class UI:
             audio_text_y = audio_panel_y + audio_panel_h - 25
             
             # Música
-            music_icon = "+" if sound_manager.music_enabled else "X"
-            music_status = "ON" if sound_manager.music_enabled else "OFF"
-            music_color = (0.5, 1.0, 0.5) if sound_manager.music_enabled else (0.8, 0.4, 0.4)
-            glColor3f(*music_color)
-            UI.draw_text(audio_text_x, audio_text_y, f"[{music_icon}] Musica [M]", 14)
+            music = bool(sound_manager.music_enabled)
+            glColor3f(*_AUDIO_COLORS[music])
+            UI.draw_text(audio_text_x, audio_text_y, _MUSIC_LABELS[music], 14)
             glColor3f(0.7, 0.7, 0.8)
-            UI.draw_text(audio_text_x + 130, audio_text_y, music_status, 14)
+            UI.draw_text(audio_text_x + 130, audio_text_y, _AUDIO_STATUS[music], 14)
             
             # Sons
             audio_text_y -= 25
-            sfx_icon = "+" if sound_manager.sfx_enabled else "X"
-            sfx_status = "ON" if sound_manager.sfx_enabled else "OFF"
-            sfx_color = (0.5, 1.0, 0.5) if sound_manager.sfx_enabled else (0.8, 0.4, 0.4)
-            glColor3f(*sfx_color)
-            UI.draw_text(audio_text_x, audio_text_y, f"[{sfx_icon}] Sons   [N]", 14)
+            sfx = bool(sound_manager.sfx_enabled)
+            glColor3f(*_AUDIO_COLORS[sfx])
+            UI.draw_text(audio_text_x, audio_text_y, _SFX_LABELS[sfx], 14)
             glColor3f(0.7, 0.7, 0.8)
-            UI.draw_text(audio_text_x + 130, audio_text_y, sfx_status, 14)
+            UI.draw_text(audio_text_x + 130, audio_text_y, _AUDIO_STATUS[sfx], 14)
 
             # Pause Hint
             audio_text_y -= 25
@@ -272,162 +886,74 @@ class UI:
         tip_text_y = tip_panel_y + 28
         
         # Dica contextual
-        if stats['boxes_on_target'] == 0:
-            glColor3f(1.0, 0.8, 0.3)
-            UI.draw_text(tip_panel_x + 12, tip_text_y, 
-                "! Dica: Empurre as caixas para os alvos vermelhos!", 14)
-        elif stats['boxes_on_target'] < stats['total_boxes']:
-            glColor3f(0.6, 0.9, 1.0)
-            UI.draw_text(tip_panel_x + 12, tip_text_y, 
-                f"! Continue! Faltam {stats['total_boxes'] - stats['boxes_on_target']} caixas", 14)
-        else:
-            glColor3f(0.5, 1.0, 0.5)
-            UI.draw_text(tip_panel_x + 12, tip_text_y, 
-                "** Perfeito! Todas as caixas no lugar!", 14)
+        glColor3f(*texts['tip_color'])
+        UI.draw_text(tip_panel_x + 12, tip_text_y, texts['tip'], 14)
         
         # Controles (linha de baixo)
         tip_text_y -= 18
         glColor3f(0.6, 0.6, 0.7)
         UI.draw_text(tip_panel_x + 12, tip_text_y, 
             "WASD: mover | SHIFT: correr | Mouse: olhar | ESPAÇO: empurrar | R: reset", 12)
-        
-        # Restaura estados
-        glEnable(GL_DEPTH_TEST)
-        glEnable(GL_LIGHTING)
-        glPopMatrix()
-        glMatrixMode(GL_PROJECTION)
-        glPopMatrix()
-        glMatrixMode(GL_MODELVIEW)
     
     @staticmethod
+    @_in_2d
     def draw_victory_screen(move_count):
         """Desenha tela de vitória de nível"""
-        glDisable(GL_LIGHTING)
-        glDisable(GL_DEPTH_TEST)
-        
-        glMatrixMode(GL_PROJECTION)
-        glPushMatrix()
-        glLoadIdentity()
-        gluOrtho2D(0, WINDOW_WIDTH, 0, WINDOW_HEIGHT)
-        glMatrixMode(GL_MODELVIEW)
-        glPushMatrix()
-        glLoadIdentity()
-        
         # Overlay verde semi-transparente
-        glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
         glColor4f(0.0, 0.8, 0.0, 0.7)
+        UI._draw_vbo(UI._fullscreen_vbo, GL_QUADS, 4)
         
-        glBegin(GL_QUADS)
-        glVertex2f(0, 0)
-        glVertex2f(WINDOW_WIDTH, 0)
-        glVertex2f(WINDOW_WIDTH, WINDOW_HEIGHT)
-        glVertex2f(0, WINDOW_HEIGHT)
-        glEnd()
-        
-        glDisable(GL_BLEND)
-        
-        # Texto
-        cx = WINDOW_WIDTH // 2
-        cy = WINDOW_HEIGHT // 2
-        
-        UI.draw_text(cx - 100, cy + 50, "PARABÉNS! LEVEL COMPLETO!", 24)
-        UI.draw_text(cx - 80, cy, f"Movimentos: {move_count}", 18)
-        UI.draw_text(cx - 180, cy - 50, 
-            "Pressione ENTER para o Próximo Level / ESC para sair", 18)
-        
-        glEnable(GL_DEPTH_TEST)
-        glEnable(GL_LIGHTING)
-        
-        glPopMatrix()
-        glMatrixMode(GL_PROJECTION)
-        glPopMatrix()
-        glMatrixMode(GL_MODELVIEW)
+        # Textos fixos numa display list; só o contador muda por nível
+        UI._draw_static_texts('victory', _VICTORY_TEXTS)
+        UI.draw_text(_CX - 80, _CY, f"Movimentos: {move_count}", 18)
     
     @staticmethod
+    @_in_2d
     def draw_final_victory_screen():
         """Desenha tela de vitória final (todos os níveis completos)"""
-        glDisable(GL_LIGHTING)
-        glDisable(GL_DEPTH_TEST)
-        
-        glMatrixMode(GL_PROJECTION)
-        glPushMatrix()
-        glLoadIdentity()
-        glOrtho(0, WINDOW_WIDTH, 0, WINDOW_HEIGHT, -1, 1)
-        glMatrixMode(GL_MODELVIEW)
-        glPushMatrix()
-        glLoadIdentity()
-        
-        # Fundo com gradiente
-        glBegin(GL_QUADS)
-        glColor3f(0.1, 0.05, 0.2)  # Roxo escuro
-        glVertex2f(0, 0)
-        glVertex2f(WINDOW_WIDTH, 0)
-        glColor3f(0.2, 0.1, 0.4)  # Roxo claro
-        glVertex2f(WINDOW_WIDTH, WINDOW_HEIGHT)
-        glVertex2f(0, WINDOW_HEIGHT)
-        glEnd()
-        
-        # Estrelas cintilantes
-        import random
-        random.seed(42)
+        # Fundo com gradiente (roxo escuro embaixo, roxo claro em cima)
+        UI._draw_vbo(UI._fullscreen_vbo, GL_QUADS, 4, UI._final_gradient_vbo)
+        
+        # Estrelas cintilantes (posições fixas, só o brilho é reenviado)
+        _star_brightness(time.time(), _STAR_BRIGHTNESS)
+        _STAR_COLORS[:] = _STAR_BRIGHTNESS[:, None]
+        glBindBuffer(GL_ARRAY_BUFFER, UI._star_color_vbo)
+        glBufferSubData(GL_ARRAY_BUFFER, 0, _STAR_COLORS.nbytes, _STAR_COLORS)
         glPointSize(2.0)
-        glBegin(GL_POINTS)
-        for i in range(100):
-            x = random.randint(50, WINDOW_WIDTH - 50)
-            y = random.randint(50, WINDOW_HEIGHT - 50)
-            brightness = 0.5 + 0.5 * abs(math.sin(time.time() * 3 + i * 0.1))
-            glColor3f(brightness, brightness, brightness)
-            glVertex2f(x, y)
-        glEnd()
-        
-        # Textos
-        cx = WINDOW_WIDTH // 2
-        cy = WINDOW_HEIGHT // 2
-        
-        glColor3f(1.0, 0.8, 0.0)  # Dourado
-        UI.draw_text(cx - 80, WINDOW_HEIGHT - 100, "PARABÉNS!", 36)
-        
-        glColor3f(0.9, 0.9, 0.9)
-        UI.draw_text(cx - 180, WINDOW_HEIGHT - 150, 
-            "VOCÊ CONQUISTOU TODOS OS DESAFIOS!", 20)
-        
-        # Troféu ASCII
-        trophy_lines = [
-            "    🏆",
-            "  ╔═══╗",
-            "  ║ ★ ║",
-            "  ╚═══╝",
-            "   ███"
-        ]
-        
-        for i, line in enumerate(trophy_lines):
-            UI.draw_text(cx - 30, cy + (len(trophy_lines) - i) * 20, line, 14)
-        
-        # Instruções
-        glColor3f(0.8, 0.8, 0.8)
-        UI.draw_text(cx - 150, 120, 
-            "Pressione ENTER para voltar ao menu", 14)
-        UI.draw_text(cx - 60, 100, "ou ESC para sair", 14)
+        UI._draw_vbo(UI._star_vbo, GL_POINTS, len(_STAR_XY), UI._star_color_vbo)
         
-        glPopMatrix()
-        glMatrixMode(GL_PROJECTION)
-        glPopMatrix()
-        glMatrixMode(GL_MODELVIEW)
-        
-        glEnable(GL_DEPTH_TEST)
-        glEnable(GL_LIGHTING)
+        # Textos (todos fixos: uma display list)
+        UI._draw_static_texts('final', _FINAL_TEXTS)
     
     @staticmethod
     def get_text_width(text, size=18):
-        """Retorna largura do texto em pixels"""
-        font = GLUT_BITMAP_HELVETICA_18 if size >= 18 else GLUT_BITMAP_8_BY_13
-        width = 0
-        for ch in text:
-            width += glutBitmapWidth(font, ord(ch))
+        """Retorna largura do texto em pixels (memorizada por fonte e texto)"""
+        key = (18 if size >= 18 else 13, text)
+        width = UI._text_widths.get(key)
+        if width is None:
+            width = UI._measure_text(text, size)
+            UI._text_widths[key] = width
         return width
+    
+    @staticmethod
+    def _measure_text(text, size):
+        """Mede a largura do texto no atlas ou nas métricas GLUT"""
+        atlas = FontAtlas.for_size(size)
+        if atlas is not None:
+            return atlas.text_width(text)
+        # Fallback GLUT: larguras por glifo consultadas uma única vez; a soma
+        # é feita no numpy sobre os bytes Latin-1, sem laço por caractere
+        key = 18 if size >= 18 else 13
+        widths = UI._glut_widths.get(key)
+        if widths is None:
+            font = _GLUT_FONTS[key]
+            widths = np.array([glutBitmapWidth(font, code) for code in range(256)],
+                              dtype=np.int32)
+            UI._glut_widths[key] = widths
+        return int(widths[np.frombuffer(_latin1_bytes(text), dtype=np.uint8)].sum())
 
     @staticmethod
+    @_batched
     def draw_button(x, y, width, height, text, mouse_x, mouse_y, is_selected=False):
         """
         Desenha um botão interativo.
@@ -445,45 +971,9 @@ class UI:
         is_hover = (x - half_w <= mouse_x <= x + half_w) and \
                    (y - half_h <= mouse_y <= y + half_h)
         
-        # Cores
-        if is_hover or is_selected:
-            bg_color = (0.3, 0.6, 1.0, 0.8) # Azul claro
-            border_color = (1.0, 1.0, 1.0, 1.0)
-            scale = 1.05
-        else:
-            bg_color = (0.2, 0.2, 0.2, 0.6) # Cinza escuro
-            border_color = (0.6, 0.6, 0.6, 1.0)
-            scale = 1.0
-            
-        # Desenha fundo
-        glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
-        glColor4f(*bg_color)
-        
-        glPushMatrix()
-        glTranslatef(x, y, 0)
-        glScalef(scale, scale, 1.0)
-        
-        glBegin(GL_QUADS)
-        glVertex2f(-half_w, -half_h)
-        glVertex2f(half_w, -half_h)
-        glVertex2f(half_w, half_h)
-        glVertex2f(-half_w, half_h)
-        glEnd()
-        
-        # Borda
-        glLineWidth(2.0)
-        glColor4f(*border_color)
-        glBegin(GL_LINE_LOOP)
-        glVertex2f(-half_w, -half_h)
-        glVertex2f(half_w, -half_h)
-        glVertex2f(half_w, half_h)
-        glVertex2f(-half_w, half_h)
-        glEnd()
-        glLineWidth(1.0)
-        
-        glDisable(GL_BLEND)
-        glPopMatrix()
+        # Fundo e borda (geometria memorizada por posição e destaque)
+        UI._push_geometry(*_button_geometry(x, y, width, height,
+                                            bool(is_hover or is_selected)))
         
         # Texto centralizado com precisão
         text_width = UI.get_text_width(text, 18)
@@ -491,36 +981,45 @@ class UI:
         text_y_offset = 5 
         UI.draw_text(x - text_width//2, y - text_y_offset, text, 18)
 
+    @staticmethod
+    @_batched
+    def draw_buttons(buttons, width, height, mouse_x, mouse_y):
+        """
+        Desenha um conjunto de botões de menu num único passo do lote.
+        
+        O hover é resolvido com os retângulos memorizados dos cliques (um
+        teste para o menu todo) e fundos e bordas vêm prontos do cache.
+        
+        Args:
+            buttons: Definições (label, action, x_off, y_off) relativas ao centro
+            width, height: Dimensões de cada botão
+            mouse_x, mouse_y: Posição do mouse para hover (Y do OpenGL)
+        """
+        actions, rects = _button_hitboxes(buttons, width, height,
+                                          WINDOW_WIDTH, WINDOW_HEIGHT)
+        hit = _hit_index(rects, mouse_x, mouse_y)
+        UI._push_geometry(*_button_row_geometry(buttons, width, height, hit))
+        
+        # Textos centralizados (mesmo ajuste vertical de draw_button)
+        for label, action, x_off, y_off in buttons:
+            text_width = UI.get_text_width(label, 18)
+            UI.draw_text(_CX + x_off - text_width//2, _CY + y_off - 5, label, 18)
+
     @staticmethod
     def get_menu_buttons():
         """Retorna definições dos botões do menu (label, action, x_offset, y_offset)"""
-        cx = WINDOW_WIDTH // 2
-        cy = WINDOW_HEIGHT // 2
-        return [
-            ("NOVO JOGO", "start", 0, 80),
-            ("CONTINUAR", "continue", 0, 20),
-            ("CONFIGURAÇÕES", "settings", 0, -50),
-            ("SAIR", "quit", 0, -120)
-        ]
+        return _MENU_BUTTONS
 
     @staticmethod
     def get_menu_action(mouse_x, mouse_y):
         """Retorna ação do botão clicado ou None"""
-        cx = WINDOW_WIDTH // 2
-        cy = WINDOW_HEIGHT // 2
-        buttons = UI.get_menu_buttons()
-        
-        for label, action, x_off, y_off in buttons:
-            bx = cx + x_off
-            by = cy + y_off
-            width, height = 200, 50
-            
-            if (bx - width//2 <= mouse_x <= bx + width//2) and \
-               (by - height//2 <= mouse_y <= by + height//2):
-                return action
-        return None
+        actions, rects = _button_hitboxes(_MENU_BUTTONS, 200, 50, WINDOW_WIDTH, WINDOW_HEIGHT)
+        hit = _hit_index(rects, mouse_x, mouse_y)
+        return actions[hit] if hit >= 0 else None
 
     @staticmethod
+    @_in_2d
+    @_batched
     def draw_menu(sound_manager=None, mouse_pos=(0,0)):
         """
         Desenha menu principal com botões.
@@ -529,33 +1028,13 @@ class UI:
             sound_manager: Gerenciador de som
             mouse_pos: Tupla (x, y) do mouse
         """
-        cx = WINDOW_WIDTH // 2
-        cy = WINDOW_HEIGHT // 2
+        cx, cy = _CX, _CY
         mx, my = mouse_pos
         # Inverte Y do mouse para coordenadas OpenGL (0 embaixo)
         gl_my = WINDOW_HEIGHT - my
         
-        # Overlay escuro
-        glDisable(GL_LIGHTING)
-        glDisable(GL_DEPTH_TEST)
-        
-        glMatrixMode(GL_PROJECTION)
-        glPushMatrix()
-        glLoadIdentity()
-        gluOrtho2D(0, WINDOW_WIDTH, 0, WINDOW_HEIGHT)
-        glMatrixMode(GL_MODELVIEW)
-        glPushMatrix()
-        glLoadIdentity()
-        
-        # Fundo gradiente (Azul Profundo)
-        glBegin(GL_QUADS)
-        glColor3f(0.02, 0.05, 0.1) # Topo escuro
-        glVertex2f(0, WINDOW_HEIGHT)
-        glVertex2f(WINDOW_WIDTH, WINDOW_HEIGHT)
-        glColor3f(0.1, 0.2, 0.4) # Base mais clara
-        glVertex2f(WINDOW_WIDTH, 0)
-        glVertex2f(0, 0)
-        glEnd()
+        # Fundo gradiente (Azul Profundo: topo escuro, base mais clara)
+        UI._draw_vbo(UI._menu_bg_vbo, GL_QUADS, 4, UI._menu_gradient_vbo)
         
         # Título com sombra
         title = "BOXPUSH 3D"
@@ -573,119 +1052,54 @@ class UI:
         UI.draw_text(cx - 120, cy + 140, subtitle, 18)
         
         # Linha decorativa
-        glColor3f(0.3, 0.6, 1.0)
-        glLineWidth(2.0)
-        glBegin(GL_LINES)
-        glVertex2f(cx - 200, cy + 130)
-        glVertex2f(cx + 200, cy + 130)
-        glEnd()
-        glLineWidth(1.0)
+        UI._push_quad(cx - 200, cy + 129, cx + 200, cy + 131, (0.3, 0.6, 1.0, 1.0))
         
         # Botões
-        buttons = UI.get_menu_buttons()
-        for label, action, x_off, y_off in buttons:
-            UI.draw_button(cx + x_off, cy + y_off, 220, 50, label, mx, gl_my)
+        UI.draw_buttons(_MENU_BUTTONS, 220, 50, mx, gl_my)
         
         # Rodapé
         glColor3f(0.5, 0.5, 0.6)
         UI.draw_text(cx - 150, 30, "Desenvolvido com Pygame + OpenGL", 14)
-        
-        glEnable(GL_DEPTH_TEST)
-        glEnable(GL_LIGHTING)
-        
-        glPopMatrix()
-        glMatrixMode(GL_PROJECTION)
-        glPopMatrix()
-        glMatrixMode(GL_MODELVIEW)
-
+    
     @staticmethod
     def get_pause_buttons():
         """Retorna lista de botões do menu de pause: (label, action, x_off, y_off)"""
-        return [
-            ("CONTINUAR", "resume", 0, 40),
-            ("SALVAR", "save", 0, -20),
-            ("CONFIGURACOES", "settings", 0, -80),
-            ("MENU PRINCIPAL", "main_menu", 0, -140)
-        ]
+        return _PAUSE_BUTTONS
 
     @staticmethod
     def get_pause_action(mouse_x, mouse_y):
         """Retorna ação do botão de pause clicado ou None"""
-        cx = WINDOW_WIDTH // 2
-        cy = WINDOW_HEIGHT // 2
-        buttons = UI.get_pause_buttons()
-        
-        for label, action, x_off, y_off in buttons:
-            bx = cx + x_off
-            by = cy + y_off
-            width, height = 220, 50
-            
-            if (bx - width//2 <= mouse_x <= bx + width//2) and \
-               (by - height//2 <= mouse_y <= by + height//2):
-                return action
-        return None
+        actions, rects = _button_hitboxes(_PAUSE_BUTTONS, 220, 50, WINDOW_WIDTH, WINDOW_HEIGHT)
+        hit = _hit_index(rects, mouse_x, mouse_y)
+        return actions[hit] if hit >= 0 else None
 
     @staticmethod
+    @_in_2d
+    @_batched
     def draw_pause_menu(mouse_pos=(0,0)):
         """
         Desenha menu de pause sobre o jogo.
         """
-        cx = WINDOW_WIDTH // 2
-        cy = WINDOW_HEIGHT // 2
+        cx, cy = _CX, _CY
         mx, my = mouse_pos
         gl_my = WINDOW_HEIGHT - my
         
-        # Overlay semi-transparente escuro
-        glDisable(GL_LIGHTING)
-        glDisable(GL_DEPTH_TEST)
-        
-        glMatrixMode(GL_PROJECTION)
-        glPushMatrix()
-        glLoadIdentity()
-        gluOrtho2D(0, WINDOW_WIDTH, 0, WINDOW_HEIGHT)
-        glMatrixMode(GL_MODELVIEW)
-        glPushMatrix()
-        glLoadIdentity()
-        
         # Fundo escuro transparente (blur effect simulado)
-        glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
         glColor4f(0.0, 0.0, 0.0, 0.7)
-        glBegin(GL_QUADS)
-        glVertex2f(0, 0)
-        glVertex2f(WINDOW_WIDTH, 0)
-        glVertex2f(WINDOW_WIDTH, WINDOW_HEIGHT)
-        glVertex2f(0, WINDOW_HEIGHT)
-        glEnd()
-        glDisable(GL_BLEND)
+        UI._draw_vbo(UI._fullscreen_vbo, GL_QUADS, 4)
         
         # Título PAUSE
         glColor3f(1.0, 1.0, 1.0)
         UI.draw_text(cx - 60, cy + 120, "JOGO PAUSADO", 24)
         
         # Linha decorativa
-        glColor3f(0.3, 0.6, 1.0)
-        glLineWidth(2.0)
-        glBegin(GL_LINES)
-        glVertex2f(cx - 150, cy + 100)
-        glVertex2f(cx + 150, cy + 100)
-        glEnd()
-        glLineWidth(1.0)
+        UI._push_quad(cx - 150, cy + 99, cx + 150, cy + 101, (0.3, 0.6, 1.0, 1.0))
         
         # Botões
-        buttons = UI.get_pause_buttons()
-        for label, action, x_off, y_off in buttons:
-            UI.draw_button(cx + x_off, cy + y_off, 220, 50, label, mx, gl_my)
-        
-        glEnable(GL_DEPTH_TEST)
-        glEnable(GL_LIGHTING)
-        
-        glPopMatrix()
-        glMatrixMode(GL_PROJECTION)
-        glPopMatrix()
-        glMatrixMode(GL_MODELVIEW)
-
+        UI.draw_buttons(_PAUSE_BUTTONS, 220, 50, mx, gl_my)
+    
     @staticmethod
+    @_batched
     def draw_slider(x, y, width, height, value, label, is_selected=False):
         """
         Desenha um slider com label.
@@ -701,48 +1115,30 @@ class UI:
             label_color = (1.0, 1.0, 0.0, 1.0) # Amarelo
         else:
             bar_color = (0.3, 0.3, 0.3, 1.0)
-            fill_color = (0.2, 0.6, 0.8, 0.8)
+            fill_color = (0.2, 0.6, 0.8, 1.0)
             label_color = (1.0, 1.0, 1.0, 1.0)
             
-        # Desenha a barra (Geometria)
-        glPushMatrix()
-        glTranslatef(x, y, 0)
+        # Desenha a barra (cores opacas)
+        left = x - width//2
+        bottom = y - height//2
+        top = y + height//2
         
         # Fundo da barra
-        glColor4f(*bar_color)
-        glBegin(GL_QUADS)
-        glVertex2f(-width//2, -height//2)
-        glVertex2f(width//2, -height//2)
-        glVertex2f(width//2, height//2)
-        glVertex2f(-width//2, height//2)
-        glEnd()
+        UI._push_quad(left, bottom, x + width//2, top, bar_color)
         
         # Preenchimento (valor)
         fill_width = width * value
-        glColor4f(*fill_color)
-        glBegin(GL_QUADS)
-        glVertex2f(-width//2, -height//2)
-        glVertex2f(-width//2 + fill_width, -height//2)
-        glVertex2f(-width//2 + fill_width, height//2)
-        glVertex2f(-width//2, height//2)
-        glEnd()
+        UI._push_quad(left, bottom, left + fill_width, top, fill_color)
         
         # Knob (indicador)
-        knob_x = -width//2 + fill_width
-        glColor4f(1.0, 1.0, 1.0, 1.0)
-        glBegin(GL_QUADS)
-        glVertex2f(knob_x - 5, -height//2 - 4)
-        glVertex2f(knob_x + 5, -height//2 - 4)
-        glVertex2f(knob_x + 5, height//2 + 4)
-        glVertex2f(knob_x - 5, height//2 + 4)
-        glEnd()
-        
-        glPopMatrix()
+        knob_x = left + fill_width
+        UI._push_quad(knob_x - 5, bottom - 4, knob_x + 5, top + 4,
+                      (1.0, 1.0, 1.0, 1.0))
         
-        # Desenha Textos (Usando coordenadas absolutas pois draw_text reseta a matriz)
+        # Desenha Textos
         
         # Label (Título) - Acima da barra
-        text_w = len(label) * 9
+        text_w = UI.get_text_width(label, 18)
         glColor3f(*label_color[:3])
         UI.draw_text(x - text_w//2, y + 25, label, 18)
         
@@ -758,11 +1154,7 @@ class UI:
     @staticmethod
     def get_settings_sliders():
         """Retorna definições dos sliders (id, label, x_offset, y_offset, width)"""
-        return [
-            (0, "Volume Música", 0, 60, 300),
-            (1, "Volume Efeitos", 0, -20, 300),
-            (2, "Sensibilidade", 0, -100, 300)
-        ]
+        return _SETTINGS_SLIDERS
 
     @staticmethod
     def get_settings_action(mouse_x, mouse_y):
@@ -772,79 +1164,41 @@ class UI:
         action_type: 'slider_drag', 'back', None
         data: (slider_id, value) ou None
         """
-        cx = WINDOW_WIDTH // 2
-        cy = WINDOW_HEIGHT // 2
+        rects, sliders = _settings_hitboxes(WINDOW_WIDTH, WINDOW_HEIGHT)
+        hit = _hit_index(rects, mouse_x, mouse_y)
         
-        # Verifica sliders
-        sliders = UI.get_settings_sliders()
-        for s_id, label, x_off, y_off, width in sliders:
-            sx = cx + x_off
-            sy = cy + y_off
-            height = 20
-            
-            # Hitbox generosa para drag
-            if (sx - width//2 - 10 <= mouse_x <= sx + width//2 + 10) and \
-               (sy - height//2 - 10 <= mouse_y <= sy + height//2 + 10):
-                
-                # Calcula valor baseado na posição X relativa
-                rel_x = mouse_x - (sx - width//2)
-                val = max(0.0, min(1.0, rel_x / width))
-                return ('slider_drag', (s_id, val))
+        if 0 <= hit < len(sliders):
+            # Calcula valor baseado na posição X relativa
+            s_id, left, width = sliders[hit]
+            val = max(0.0, min(1.0, (mouse_x - left) / width))
+            return ('slider_drag', (s_id, val))
         
-        # Botão Voltar
-        back_y = cy - 200
-        # Corrigido: Largura 120 (metade 60)
-        if (cx - 60 <= mouse_x <= cx + 60) and (back_y - 20 <= mouse_y <= back_y + 20):
+        # Botão Voltar (último retângulo)
+        if hit == len(sliders):
             return ('back', None)
             
         return (None, None)
 
     @staticmethod
+    @_in_2d
+    @_batched
     def draw_settings_menu(selected_option, music_vol, sfx_vol, sensitivity, mouse_pos=(0,0)):
         """
         Desenha menu de configurações com sliders.
         """
-        cx = WINDOW_WIDTH // 2
-        cy = WINDOW_HEIGHT // 2
+        cx, cy = _CX, _CY
         mx, my = mouse_pos
         gl_my = WINDOW_HEIGHT - my
         
-        # Overlay escuro com gradiente radial (simulado)
-        glDisable(GL_LIGHTING)
-        glDisable(GL_DEPTH_TEST)
-        
-        glMatrixMode(GL_PROJECTION)
-        glPushMatrix()
-        glLoadIdentity()
-        gluOrtho2D(0, WINDOW_WIDTH, 0, WINDOW_HEIGHT)
-        glMatrixMode(GL_MODELVIEW)
-        glPushMatrix()
-        glLoadIdentity()
-        
-        # Fundo
-        glBegin(GL_QUADS)
-        # Topo (Azul escuro)
-        glColor3f(0.05, 0.1, 0.2)
-        glVertex2f(0, WINDOW_HEIGHT)
-        glVertex2f(WINDOW_WIDTH, WINDOW_HEIGHT)
-        # Base (Preto)
-        glColor3f(0.0, 0.0, 0.05)
-        glVertex2f(WINDOW_WIDTH, 0)
-        glVertex2f(0, 0)
-        glEnd()
+        # Fundo (topo azul escuro, base preta)
+        UI._draw_vbo(UI._menu_bg_vbo, GL_QUADS, 4, UI._settings_gradient_vbo)
         
         # Título
         glColor3f(1.0, 1.0, 1.0)
         UI.draw_text(cx - 100, cy + 160, "CONFIGURAÇÕES", 24)
         
         # Linha decorativa abaixo do título
-        glColor3f(0.3, 0.6, 1.0)
-        glLineWidth(2.0)
-        glBegin(GL_LINES)
-        glVertex2f(cx - 120, cy + 150)
-        glVertex2f(cx + 120, cy + 150)
-        glEnd()
-        glLineWidth(1.0)
+        UI._push_quad(cx - 120, cy + 149, cx + 120, cy + 151, (0.3, 0.6, 1.0, 1.0))
         
         # Sliders
         # Normaliza sensibilidade para 0-1 (assumindo range 0.01 - 0.5)
@@ -858,13 +1212,36 @@ class UI:
             UI.draw_slider(cx + x_off, cy + y_off, width, 20, val, label, i == selected_option)
         
         # Botão Voltar
-        back_y = cy - 200
-        UI.draw_button(cx, back_y, 120, 40, "VOLTAR", mx, gl_my)
-        
-        glEnable(GL_DEPTH_TEST)
-        glEnable(GL_LIGHTING)
-        
-        glPopMatrix()
-        glMatrixMode(GL_PROJECTION)
-        glPopMatrix()
-        glMatrixMode(GL_MODELVIEW)
+        UI.draw_buttons(_SETTINGS_BUTTONS, 120, 40, mx, gl_my)
+    
+    @staticmethod
+    def cleanup():
+        """Libera os VBOs da interface e os atlas de fonte"""
+        vbos = [UI._fullscreen_vbo, UI._final_gradient_vbo, UI._menu_bg_vbo,
+                UI._menu_gradient_vbo, UI._settings_gradient_vbo,
+                UI._crosshair_vbo, UI._star_vbo, UI._star_color_vbo]
+        for vbo in vbos:
+            if vbo is not None:
+                glDeleteBuffers(1, [vbo])
+        UI._fullscreen_vbo = None
+        UI._final_gradient_vbo = None
+        UI._menu_bg_vbo = None
+        UI._menu_gradient_vbo = None
+        UI._settings_gradient_vbo = None
+        UI._crosshair_vbo = None
+        UI._star_vbo = None
+        UI._star_color_vbo = None
+        
+        for base in UI._glut_list_bases.values():
+            glDeleteLists(base, 256)
+        UI._glut_list_bases.clear()
+        UI._clear_text_lists()
+        UI._text_widths.clear()
+        for list_id in UI._screen_lists.values():
+            glDeleteLists(list_id, 1)
+        UI._screen_lists.clear()
+        if UI._hud_list is not None:
+            glDeleteLists(UI._hud_list, 1)
+        UI._hud_list = None
+        UI._hud_list_key = None
+        FontAtlas.cleanup()
@@ -0,0 +1,114 @@
+"""
+tests/test_level.py
+===================
+Testes unitários para o módulo game/level.py
+
+Para executar os testes:
+    pytest tests/test_level.py -v
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Adiciona o diretório raiz ao path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import game.level
+from game.level import Level
+
+
+class _FakeClouds:
+    """Substitui CloudSystem (exige contexto OpenGL)"""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def render(self, camera_pos):
+        pass
+
+    def cleanup(self):
+        pass
+
+
+@pytest.fixture
+def level(monkeypatch):
+    """Nível 0 carregado sem nuvens"""
+    monkeypatch.setattr(game.level, 'CloudSystem', _FakeClouds)
+    lvl = Level()
+    assert lvl.load_level(0)
+    return lvl
+
+
+class TestObjectivesSet:
+    """Testes do conjunto de objetivos pré-calculado"""
+
+    def test_objectives_set_matches_objectives(self, level):
+        """Testa que o conjunto reflete a lista de objetivos do nível"""
+        assert level.objectives_set == frozenset(level.objectives)
+
+    def test_objectives_set_recomputed_on_load(self, level):
+        """Testa que trocar de nível recalcula o conjunto"""
+        level.load_level(1)
+        assert level.objectives_set == frozenset(level.objectives)
+
+
+class TestVictory:
+    """Testes de vitória e estatísticas"""
+
+    def test_no_victory_at_start(self, level):
+        """Testa que o nível não começa resolvido"""
+        assert not level.check_victory()
+
+    def test_victory_when_all_boxes_on_targets(self, level):
+        """Testa vitória com todas as caixas nos objetivos"""
+        level.boxes = list(level.objectives)
+        assert level.check_victory()
+        assert level.get_progress_stats()['completion_percent'] == 100
+
+
+class TestVersion:
+    """Testes do contador de versão usado pelo cache do renderer"""
+
+    def test_push_increments_version(self, level):
+        """Testa que empurrar uma caixa invalida o cache"""
+        before = level.version
+        assert level.push_box(0.0, 0.0, 0, 1, 0.0)
+        assert level.version == before + 1
+
+    def test_reload_increments_version(self, level):
+        """Testa que recarregar o nível nunca reaproveita uma versão antiga"""
+        before = level.version
+        level.reload_current_level()
+        assert level.version > before
+
+
+class TestArrays:
+    """Testes das posições em formato NumPy"""
+
+    def test_arrays_match_lists(self, level):
+        """Testa que os arrays espelham as listas do nível"""
+        assert level.walls_np.tolist() == [list(w) for w in level.walls]
+        assert level.objectives_np.tolist() == [list(o) for o in level.objectives]
+
+    def test_boxes_np_follows_push(self, level):
+        """Testa que empurrar atualiza também o array de caixas"""
+        level.push_box(0.0, 0.0, 0, 1, 0.0)
+        assert level.boxes_np.tolist() == [list(b) for b in level.boxes]
+
+
+class TestParticles:
+    """Testes do pool de partículas"""
+
+    def test_push_onto_target_spawns_particles(self, level):
+        """Testa que uma caixa no objetivo gera partículas no pool"""
+        level.objectives_set = frozenset([(0, 0, 2)])
+        level.push_box(0.0, 0.0, 0, 1, 10.0)
+        assert level.get_active_particles().shape == (50, 11)
+
+    def test_expired_particles_are_removed(self, level):
+        """Testa que partículas expiradas saem da parte ativa do pool"""
+        level.objectives_set = frozenset([(0, 0, 2)])
+        level.push_box(0.0, 0.0, 0, 1, 10.0)
+        level.update_particles(20.0, 0.016)
+        assert level.particle_count == 0
@@ -0,0 +1,115 @@
+"""
+tests/test_renderer.py
+======================
+Testes unitários para os cálculos NumPy de graphics/renderer.py
+
+Para executar os testes:
+    pytest tests/test_renderer.py -v
+"""
+
+import pytest
+import sys
+import random
+from pathlib import Path
+import numpy as np
+
+# Adiciona o diretório raiz ao path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import game.level
+from game.level import Level
+from game.player import Player
+from graphics.renderer import Renderer
+
+
+class _FakeClouds:
+    """Substitui CloudSystem (exige contexto OpenGL)"""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def render(self, camera_pos):
+        pass
+
+    def cleanup(self):
+        pass
+
+
+@pytest.fixture
+def level(monkeypatch):
+    """Nível 0 carregado sem nuvens"""
+    monkeypatch.setattr(game.level, 'CloudSystem', _FakeClouds)
+    lvl = Level()
+    assert lvl.load_level(0)
+    return lvl
+
+
+class TestBoxStatuses:
+    """Testes da classificação vetorizada das caixas"""
+
+    def test_matches_get_box_status(self, level):
+        """Testa que a versão vetorizada concorda com get_box_status"""
+        rng = random.Random(42)
+        player = Player()
+        seen = set()
+
+        for level_index in (0, 1, 2):
+            assert level.load_level(level_index)
+            for _ in range(1000):
+                # Jogador perto de uma caixa qualquer, olhando numa direção aleatória
+                bx, _, bz = rng.choice(level.boxes)
+                player.x = bx + rng.uniform(-3.0, 3.0)
+                player.z = bz + rng.uniform(-3.0, 3.0)
+                player.camera_yaw = rng.uniform(-360.0, 360.0)
+
+                # Às vezes uma caixa já está no objetivo
+                objectives = set(level.objectives)
+                if rng.random() < 0.3:
+                    objectives.add(rng.choice(level.boxes))
+
+                codes = Renderer.compute_all_box_statuses(
+                    level.boxes, list(objectives), player, level)
+                expected = [Renderer.get_box_status(box, frozenset(objectives), player, level)
+                            for box in level.boxes]
+                assert [Renderer.BOX_STATUSES[c] for c in codes] == expected
+                seen.update(expected)
+
+        # O sorteio cobre todos os status
+        assert seen == set(Renderer.BOX_STATUSES)
+
+    def test_no_boxes(self, level):
+        """Testa que uma lista vazia de caixas não gera status"""
+        codes = Renderer.compute_all_box_statuses([], level.objectives, Player(), level)
+        assert codes.shape == (0,)
+
+
+class TestParticleSprites:
+    """Testes do cálculo de alpha e tamanho das partículas"""
+
+    def _particles(self, start_times):
+        """Partículas com cor e tamanho conhecidos"""
+        particles = np.zeros((len(start_times), 11))
+        particles[:, 0:3] = np.arange(len(start_times))[:, None]
+        particles[:, 6:9] = (1.0, 0.5, 0.25)
+        particles[:, 9] = start_times
+        particles[:, 10] = 0.5
+        return particles
+
+    def test_alpha_and_size(self):
+        """Testa o fade linear em 4 segundos e o tamanho proporcional"""
+        sprites = Renderer.compute_particle_sprites(self._particles([100.0, 99.0, 97.0]), 100.0)
+        assert sprites.shape == (3, 8)
+        assert sprites[:, 6] == pytest.approx([1.0, 0.75, 0.25])
+        assert sprites[:, 7] == pytest.approx([0.6, 0.45, 0.15])
+        assert sprites[:, 3:6].tolist() == [[1.0, 0.5, 0.25]] * 3
+
+    def test_expired_particles_are_dropped(self):
+        """Testa que só partículas com menos de 4 segundos sobrevivem"""
+        sprites = Renderer.compute_particle_sprites(self._particles([100.0, 96.0, 90.0, 98.0]), 100.0)
+        assert sprites[:, 0].tolist() == [0.0, 3.0]
+
+    def test_large_timestamps_keep_precision(self):
+        """Testa que timestamps grandes (time.time()) não perdem precisão"""
+        now = 1.7e9
+        sprites = Renderer.compute_particle_sprites(self._particles([now - 2.0]), now)
+        assert sprites[0, 6] == pytest.approx(0.5)